@@ -1,5 +1,18 @@
 """Automaton implementation."""
-from typing import Collection, Optional, Tuple, Dict, List
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from automata.interfaces import (
     AbstractFiniteAutomaton,
@@ -7,10 +20,15 @@ from automata.interfaces import (
     AbstractTransition,
 )
 
+if TYPE_CHECKING:
+    from automata.compiled import CompiledDFA
+
 
 class State(AbstractState):
     """State of an automaton."""
 
+    __slots__ = ()
+
     # You can add new attributes and methods that you think that make your
     # task easier, but you cannot change the constructor interface.
 
@@ -18,6 +36,8 @@ class State(AbstractState):
 class Transition(AbstractTransition[State]):
     """Transition of an automaton."""
 
+    __slots__ = ()
+
     # You can add new attributes and methods that you think that make your
     # task easier, but you cannot change the constructor interface.
 
@@ -28,6 +48,10 @@ class FiniteAutomaton(
     """Automaton."""
 
     sumidero: Optional[State]
+    _symbol_index: Optional[Dict[State, Dict[str, List[State]]]]
+    _lambda_index: Optional[Dict[State, List[State]]]
+    _closures: Dict[State, FrozenSet[State]]
+    _live_states: Optional[FrozenSet[State]]
 
     def __init__(
         self,
@@ -36,15 +60,84 @@ class FiniteAutomaton(
         states: Collection[State],
         symbols: Collection[str],
         transitions: Collection[Transition],
+        validate: bool = True,
     ) -> None:
         super().__init__(
             initial_state=initial_state,
             states=states,
             symbols=symbols,
             transitions=transitions,
+            validate=validate,
         )
 
         self.sumidero = None
+        self._symbol_index = None
+        self._lambda_index = None
+        self._closures = {}
+        self._live_states = None
+
+    def _build_index(self) -> None:
+        """
+        Construye (una sola vez) los indices de adyacencia del automata:
+        {estado: {simbolo: estados destino}} y {estado: estados destino por
+        lambda}. Como las transiciones se guardan en una tupla inmutable no
+        hace falta invalidarlos nunca.
+
+        """
+        symbol_index: Dict[State, Dict[str, List[State]]] = {}
+        lambda_index: Dict[State, List[State]] = {}
+        for tr in self.transitions:
+            if tr.symbol is None:
+                lambda_index.setdefault(tr.initial_state, []).append(
+                    tr.final_state,
+                )
+            else:
+                symbol_index.setdefault(tr.initial_state, {}).setdefault(
+                    tr.symbol, [],
+                ).append(tr.final_state)
+
+        self._symbol_index = symbol_index
+        self._lambda_index = lambda_index
+
+    def outgoing(self, state: State) -> Mapping[str, Sequence[State]]:
+        """
+        Return the non-lambda transitions leaving a state.
+
+        Args:
+            state: Source state.
+
+        Returns:
+            Mapping from each symbol to the states reached with it.
+
+        """
+        if self._symbol_index is None:
+            self._build_index()
+        assert self._symbol_index is not None
+        return self._symbol_index.get(state, {})
+
+    def successors(
+        self,
+        state: State,
+        symbol: Optional[str],
+    ) -> Sequence[State]:
+        """
+        Return the states reached from a state with one transition.
+
+        Args:
+            state: Source state.
+            symbol: Symbol consumed. ``None`` for lambda transitions.
+
+        Returns:
+            States reached from ``state`` consuming ``symbol``.
+
+        """
+        if self._symbol_index is None or self._lambda_index is None:
+            self._build_index()
+        assert self._symbol_index is not None
+        assert self._lambda_index is not None
+        if symbol is None:
+            return self._lambda_index.get(state, ())
+        return self._symbol_index.get(state, {}).get(symbol, ())
 
     def to_deterministic(
         self,
@@ -56,142 +149,579 @@ class FiniteAutomaton(
             Equivalent deterministic automaton.
 
         """
+        return self._determinize([self.initial_state])
+
+    def _determinize(
+        self,
+        initial_states: Collection[State],
+    ) -> "FiniteAutomaton":
+        """
+        Devuelve un automata determinista equivalente al que se obtendria
+        empezando a la vez desde todos los estados dados.
+
+        Returns:
+            Automata determinista equivalente.
+
+        """
+        subsets, rows = self._subset_construction(initial_states)
+
+        # Solo ahora generamos los nombres (y los estados) de los subconjuntos
+        names = set()
+        new_states_list = []
+        for subset in subsets:
+            if subset:
+                name = self._joint_name([self.states[q] for q in subset])
+            else:
+                name = 'empty'
+            # Nombres como q1+q12 y q11+q2 coinciden: los distinguimos
+            unique_name = name
+            k = 1
+            while unique_name in names:
+                unique_name = f"{name}_{k}"
+                k += 1
+            names.add(unique_name)
+            new_states_list.append(State(
+                unique_name,
+                is_final=any(self.states[q].is_final for q in subset),
+            ))
+
         new_transitions = set()
+        for state, row in zip(new_states_list, rows):
+            for symbol, j in row.items():
+                new_transitions.add(Transition(state, symbol, new_states_list[j]))
+
+        new_automaton = FiniteAutomaton(
+            initial_state=new_states_list[0],
+            states=new_states_list,
+            symbols=self.symbols,
+            transitions=new_transitions,
+            validate=False,
+        )
 
-        # Creamos el estado inicial y computamos su clausura lambda
-        list_reachable, final = self._complete_lambda(self.initial_state)
-        new_initial_state = State(self._joint_name(list_reachable), is_final=final)
+        # El subconjunto vacio es el sumidero
+        if frozenset() in subsets:
+            self.sumidero = new_states_list[subsets.index(frozenset())]
+            new_automaton.sumidero = self.sumidero
 
-        # Creamos un diccionario {nombre nuevo estado: estados que junta}
-        new_states_dic = {new_initial_state.name: list_reachable}
+        return new_automaton
 
-        new_states_list = [new_initial_state]
-        i = 0
-        # Mientras aparezcan nuevos estados iteramos por ellos
-        while i < len(new_states_list):
-            state = new_states_list[i]
-            # Diccionario que guardara {simbolo: estados finales} desde el estado
-            # de la iteracion actual
-            trans_dic = {}
-            # Para los estados que tiene el estado junto encontramos todas las transiciones
-            for st in new_states_dic[state.name]:
-                for tr in self.transitions:
-                    if tr.initial_state == st and tr.symbol in self.symbols:
-                        if tr.symbol not in trans_dic:
-                            trans_dic[tr.symbol] = {tr.final_state}
-                        else:
-                            trans_dic[tr.symbol].add(tr.final_state)
-
-            # Completamos lambdas de los nuevos estados alcanzados y cambiamos is_final si es necesario
-            for symbol in trans_dic.keys():
-                is_final = False
-                for st in trans_dic[symbol]:
-                    list_reachable, final = self._complete_lambda(st)
-                    if final is True:
-                        is_final = final
-                    trans_dic[symbol] = trans_dic[symbol].union(set(list_reachable))
-
-                # Guardamos el nuevo estado conseguido en la lista si no lo hemos
-                # analizado antes y anadimos la nueva transicion
-                name = self._joint_name(list(trans_dic[symbol]))
-                if name not in new_states_dic:
-                    new_states_dic[name] = list(trans_dic[symbol])
-                    new_state = State(name, is_final=is_final)
-                    new_states_list.append(new_state)
-                    tr = Transition(state, symbol, new_state)
-                else:
-                    for st in new_states_list:
-                        if st.name == name:
-                            tr = Transition(state, symbol, st)
-                            break
-                new_transitions.add(tr)
+    def _subset_construction(
+        self,
+        initial_states: Collection[State],
+    ) -> Tuple[List[FrozenSet[int]], List[Dict[str, int]]]:
+        """
+        Construccion por subconjuntos. Los estados se identifican por su
+        posicion en self.states y cada subconjunto alcanzado por un
+        frozenset de posiciones, con un diccionario {subconjunto: numero}
+        para encontrar en O(1) los que ya hemos visto.
+
+        Returns:
+            Tupla con la lista de subconjuntos alcanzados (el primero es el
+            inicial) y, para cada uno, un diccionario {simbolo: numero del
+            subconjunto destino}. Los simbolos sin transiciones llevan al
+            subconjunto vacio (el sumidero).
+
+        """
+        ids = {st: i for i, st in enumerate(self.states)}
 
-            # Para los símbolos sin transiciones los llevamos al sumidero
+        # Solo calculamos clausuras de los subconjuntos que se alcanzan
+        initial_subset = frozenset(
+            ids[st] for st in self.epsilon_closure(initial_states)
+        )
+        subsets = [initial_subset]
+        subset_ids = {initial_subset: 0}
+        rows: List[Dict[str, int]] = []
+
+        i = 0
+        # Mientras aparezcan nuevos subconjuntos iteramos por ellos
+        while i < len(subsets):
+            # {simbolo: estados alcanzados (sin su clausura lambda)}
+            reached: Dict[str, List[State]] = {}
+            for q in subsets[i]:
+                for symbol, targets in self.outgoing(self.states[q]).items():
+                    reached.setdefault(symbol, []).extend(targets)
+
+            row = {}
             for symbol in self.symbols:
-                if symbol not in trans_dic.keys():
-                    if self.sumidero is None:
-                        self.sumidero = State('empty', is_final = False)
-                    new_transitions.add(Transition(state, symbol, self.sumidero))
+                # Clausura de todos los alcanzados con una sola busqueda
+                closure = self.epsilon_closure(reached.get(symbol, ()))
+                subset = frozenset(ids[t] for t in closure)
+                j = subset_ids.get(subset)
+                if j is None:
+                    j = len(subsets)
+                    subset_ids[subset] = j
+                    subsets.append(subset)
+                row[symbol] = j
+            rows.append(row)
 
             i += 1
 
-        # Creamos los bucles del sumidero
-        if self.sumidero is not None:
-            for s in self.symbols:
-                new_transitions.add(Transition(self.sumidero, s, self.sumidero))
-            new_states_list.append(self.sumidero)
+        return subsets, rows
 
+    def epsilon_closure(self, states: Iterable[State]) -> FrozenSet[State]:
+        """
+        Return the states reachable with lambda transitions.
 
-        return FiniteAutomaton(initial_state=new_initial_state, states=new_states_list,
-                                symbols=self.symbols, transitions=new_transitions)
+        The closure of a single state is computed the first time it is
+        needed and reused afterwards. The closure of several states is
+        computed with one search over all of them, which reuses the known
+        closures but does not store new ones, so its cost is proportional
+        to the size of the result.
 
+        Args:
+            states: States whose closure must be computed.
+
+        Returns:
+            Set with the given states and every state reachable from them
+            with any number of lambda transitions.
 
-    def _joint_name(self, state_list: Collection[State]) -> str:
         """
-        Dada una lista de estados calcula un nombre conjunto (en orden alfabetico)
+        reached: Set[State] = set()
+        pending: List[State] = []
+        for st in states:
+            if st in reached:
+                continue
+            known = self._closures.get(st)
+            if known is None:
+                reached.add(st)
+                pending.append(st)
+            else:
+                reached |= known
+
+        # Solo guardamos las clausuras de un estado: guardar las de todos los
+        # estados recorridos gastaria memoria cuadratica en cadenas largas de
+        # transiciones lambda, como las de las uniones grandes
+        single = pending[0] if len(pending) == 1 == len(reached) else None
+
+        while pending:
+            for target in self.successors(pending.pop(), None):
+                if target in reached:
+                    continue
+                # Si ya conocemos su clausura no hace falta recorrerla
+                known = self._closures.get(target)
+                if known is None:
+                    reached.add(target)
+                    pending.append(target)
+                else:
+                    reached |= known
+
+        closure = frozenset(reached)
+        if single is not None:
+            self._closures[single] = closure
+        return closure
+
+    def live_states(self) -> FrozenSet[State]:
+        """
+        Return the states from which a final state can be reached.
+
+        Once the current states of an evaluation contain none of them, no
+        continuation of the input can be accepted. They are computed the
+        first time and reused afterwards.
 
         Returns:
-            String con el nombre conjunto.
+            Set of the co-reachable states.
 
         """
-        sorted_list=sorted(state_list, key=lambda st: st.name)
-        joint_name = ''
-        for st in sorted_list:
-            joint_name += st.name
-        return joint_name
+        if self._live_states is None:
+            # Recorremos hacia atras las transiciones desde los finales
+            predecessors: Dict[State, List[State]] = {}
+            for tr in self.transitions:
+                predecessors.setdefault(tr.final_state, []).append(
+                    tr.initial_state,
+                )
+
+            live = {st for st in self.states if st.is_final}
+            pending = list(live)
+            while pending:
+                for st in predecessors.get(pending.pop(), ()):
+                    if st not in live:
+                        live.add(st)
+                        pending.append(st)
+
+            self._live_states = frozenset(live)
+
+        return self._live_states
+
+    def reverse(self) -> "FiniteAutomaton":
+        """
+        Return an automaton that accepts the reversed strings.
+
+        Returns:
+            Automaton with every transition reversed, whose final state is the
+            old initial state and whose initial state leads to the old final
+            states.
+
+        """
+        new_states, new_transitions = self._reversed()
+
+        finals = [st for st in self.states if st.is_final]
+        if len(finals) == 1:
+            initial_state = new_states[finals[0]]
+        else:
+            # Nuevo estado inicial con transiciones lambda a los finales
+            names = {st.name for st in self.states}
+            name = "qi"
+            while name in names:
+                name += "_"
+            initial_state = State(name, is_final=False)
+            for st in finals:
+                new_transitions.add(
+                    Transition(initial_state, None, new_states[st]),
+                )
+
+        states = list(new_states.values())
+        if initial_state not in states:
+            states.append(initial_state)
+
+        return FiniteAutomaton(initial_state=initial_state, states=states,
+                                symbols=self.symbols, transitions=new_transitions,
+                                validate=False)
+
+    def _reversed(self) -> Tuple[Dict[State, State], Set[Transition]]:
+        """
+        Invierte todas las transiciones del automata. El unico estado final
+        pasa a ser el antiguo estado inicial.
+
+        Returns:
+            Tupla con un diccionario {estado: estado invertido} y el conjunto
+            de transiciones invertidas.
+
+        """
+        new_states = {
+            st: State(st.name, is_final=st == self.initial_state)
+            for st in self.states
+        }
+        new_transitions = {
+            Transition(
+                new_states[tr.final_state],
+                tr.symbol,
+                new_states[tr.initial_state],
+            )
+            for tr in self.transitions
+        }
+        return new_states, new_transitions
+
+    def _reverse_deterministic(self) -> "FiniteAutomaton":
+        """
+        Devuelve el determinista del automata inverso, partiendo a la vez de
+        todos los antiguos estados finales (en lugar de un nuevo estado
+        inicial con transiciones lambda, que impediria que el resultado de
+        Brzozowski sea minimo).
+
+        Returns:
+            Automata determinista que acepta las cadenas invertidas.
+
+        """
+        new_states, new_transitions = self._reversed()
+        reversed_automaton = FiniteAutomaton(
+            initial_state=new_states[self.initial_state],
+            states=new_states.values(),
+            symbols=self.symbols,
+            transitions=new_transitions,
+            validate=False,
+        )
+        return reversed_automaton._determinize(
+            [new_states[st] for st in self.states if st.is_final],
+        )
+
+    def intersection(
+        self,
+        other: "FiniteAutomaton",
+        *,
+        minimize: bool = False,
+    ) -> "FiniteAutomaton":
+        """
+        Return an automaton that accepts the strings accepted by both.
+
+        Args:
+            other: Second automaton.
+            minimize: Whether to minimize the result. Minimization runs
+                after the reachable product is built, so it does not reduce
+                the peak size: while building, only the pairs that cannot
+                accept are merged into a single sink.
+
+        Returns:
+            Deterministic automaton of the intersection.
+
+        """
+        return self._product(other, lambda a, b: a and b, minimize=minimize)
 
-    def _complete_lambda(self, state: State) -> Tuple[Collection[State], bool]:
+    def difference(
+        self,
+        other: "FiniteAutomaton",
+        *,
+        minimize: bool = False,
+    ) -> "FiniteAutomaton":
         """
-        Dado un estado calcula su clausura segun self.transitions. Ademas, ve si
-        alguno de los estados alcanzados es final y lo devuelve.
+        Return an automaton that accepts the strings accepted only by self.
+
+        Args:
+            other: Automaton whose strings are removed.
+            minimize: Whether to minimize the result. Minimization runs
+                after the reachable product is built, so it does not reduce
+                the peak size: while building, only the pairs that cannot
+                accept are merged into a single sink.
 
         Returns:
-            Tupla con una lista de estados alcanzables (clausura lambda) y un
-            booleano indicando si entre ellos algun valor es final.
+            Deterministic automaton of the difference.
 
+        """
+        return self._product(
+            other, lambda a, b: a and not b, minimize=minimize,
+        )
 
+    def symmetric_difference(
+        self,
+        other: "FiniteAutomaton",
+        *,
+        minimize: bool = False,
+    ) -> "FiniteAutomaton":
         """
-        # Añadimos el propio estado a la clausura
-        list_reachable = [state]
+        Return an automaton that accepts the strings accepted by only one.
+
+        Args:
+            other: Second automaton.
+            minimize: Whether to minimize the result. Minimization runs
+                after the reachable product is built, so it does not reduce
+                the peak size: while building, only the pairs that cannot
+                accept are merged into a single sink.
 
-        length_list = len(list_reachable)
+        Returns:
+            Deterministic automaton of the symmetric difference.
+
+        """
+        return self._product(other, lambda a, b: a != b, minimize=minimize)
+
+    def complement(
+        self,
+        symbols: Collection[str] = (),
+        *,
+        minimize: bool = False,
+    ) -> "FiniteAutomaton":
+        """
+        Return an automaton that accepts the strings not accepted by self.
+
+        Args:
+            symbols: Symbols added to the alphabet of the automaton, whose
+                strings are also accepted by the complement.
+            minimize: Whether to minimize the result. Minimization runs
+                after the reachable product is built, so it does not reduce
+                the peak size: while building, only the pairs that cannot
+                accept are merged into a single sink.
+
+        Returns:
+            Deterministic automaton of the complement.
+
+        """
+        # Automata que acepta todas las cadenas del alfabeto
+        universal = State("all", is_final=True)
+        alphabet = tuple(dict.fromkeys([*self.symbols, *symbols]))
+        return FiniteAutomaton(
+            initial_state=universal,
+            states=[universal],
+            symbols=alphabet,
+            transitions=[
+                Transition(universal, symbol, universal)
+                for symbol in alphabet
+            ],
+            validate=False,
+        )._product(self, lambda a, b: a and not b, minimize=minimize)
+
+    def _product(
+        self,
+        other: "FiniteAutomaton",
+        accept: Callable[[bool, bool], bool],
+        *,
+        minimize: bool,
+    ) -> "FiniteAutomaton":
+        """
+        Construccion producto de los deterministas de los dos automatas,
+        sobre la union de sus alfabetos. Solo se generan los pares de
+        subconjuntos alcanzables, y todos los pares desde los que ya no se
+        puede aceptar (segun los estados vivos de cada automata) se juntan
+        en un unico sumidero. Si minimize es cierto se minimiza al final,
+        sobre el producto ya construido.
+
+        Returns:
+            Automata determinista completo cuyos estados finales son los
+            pares para los que accept(final en self, final en other) es
+            cierto.
+
+        """
+        symbols = tuple(dict.fromkeys([*self.symbols, *other.symbols]))
+        automata = (self, other)
+        alphabets = (frozenset(self.symbols), frozenset(other.symbols))
+        lives = (self.live_states(), other.live_states())
+        # {(subconjunto, simbolo): subconjunto siguiente} de cada automata
+        steps: List[Dict[Tuple[FrozenSet[State], str], FrozenSet[State]]] = [
+            {}, {},
+        ]
+
+        def step(
+            k: int,
+            subset: FrozenSet[State],
+            symbol: str,
+        ) -> FrozenSet[State]:
+            """Avanza un subconjunto del automata k con un simbolo."""
+            key = (subset, symbol)
+            target = steps[k].get(key)
+            if target is None:
+                automaton = automata[k]
+                if symbol in alphabets[k]:
+                    target = automaton.epsilon_closure(
+                        t for st in subset
+                        for t in automaton.successors(st, symbol)
+                    )
+                else:
+                    target = frozenset()
+                steps[k][key] = target
+            return target
+
+        def is_dead(pair: Tuple[FrozenSet[State], ...]) -> bool:
+            """Comprueba si ninguna continuacion lleva a un par final."""
+            # Un subconjunto sin estados vivos nunca tendra un final
+            outcomes = [
+                (False, True) if not lives[k].isdisjoint(subset) else (False,)
+                for k, subset in enumerate(pair)
+            ]
+            return not any(
+                accept(a, b) for a in outcomes[0] for b in outcomes[1]
+            )
+
+        initial_pair = (
+            self.epsilon_closure([self.initial_state]),
+            other.epsilon_closure([other.initial_state]),
+        )
+        pairs: List[Tuple[FrozenSet[State], ...]] = []
+        pair_ids: Dict[Tuple[FrozenSet[State], ...], int] = {}
+        sink = -1
+        rows: List[List[int]] = []
+
+        def pair_id(pair: Tuple[FrozenSet[State], ...]) -> int:
+            """Numera un par nuevo, o devuelve el sumidero si esta muerto."""
+            nonlocal sink
+            i = pair_ids.get(pair)
+            if i is None:
+                if is_dead(pair):
+                    if sink < 0:
+                        sink = len(pairs)
+                        pairs.append(pair)
+                    i = sink
+                else:
+                    i = len(pairs)
+                    pairs.append(pair)
+                pair_ids[pair] = i
+            return i
+
+        pair_id(initial_pair)
         i = 0
-        # Iterar mientras haya estados de los que no se ha calculado las transiciones lambda
-        final = state.is_final
-        while i < length_list:
-            for tr in self.transitions:
-                if tr.initial_state == list_reachable[i] and \
-                        tr.symbol is None and tr.final_state not in list_reachable:
-                    list_reachable.append(tr.final_state)
-                    if tr.final_state.is_final:
-                        final = True
-                    length_list += 1
+        while i < len(pairs):
+            if i == sink:
+                rows.append([sink] * len(symbols))
+            else:
+                subset1, subset2 = pairs[i]
+                rows.append([
+                    pair_id((
+                        step(0, subset1, symbol),
+                        step(1, subset2, symbol),
+                    ))
+                    for symbol in symbols
+                ])
             i += 1
-        return list_reachable, final
+
+        new_states = []
+        for i, (subset1, subset2) in enumerate(pairs):
+            new_states.append(State(
+                "empty" if i == sink else "q" + str(i),
+                is_final=i != sink and accept(
+                    any(st.is_final for st in subset1),
+                    any(st.is_final for st in subset2),
+                ),
+            ))
+
+        new_automaton = FiniteAutomaton(
+            initial_state=new_states[0],
+            states=new_states,
+            symbols=symbols,
+            transitions=[
+                Transition(new_states[i], symbol, new_states[j])
+                for i, row in enumerate(rows)
+                for symbol, j in zip(symbols, row)
+            ],
+            validate=False,
+        )
+        if sink >= 0:
+            new_automaton.sumidero = new_states[sink]
+
+        if minimize:
+            return new_automaton.to_minimized()
+        return new_automaton
+
+    def compile(self) -> "CompiledDFA":
+        """
+        Compile a deterministic automaton into a table-driven matcher.
+
+        Returns:
+            Immutable matcher equivalent to the automaton.
+
+        """
+        from automata.compiled import CompiledDFA
+
+        return CompiledDFA.from_automaton(self)
+
+    def _joint_name(self, state_list: Collection[State]) -> str:
+        """
+        Dada una lista de estados calcula un nombre conjunto (en orden alfabetico)
+
+        Returns:
+            String con el nombre conjunto.
+
+        """
+        sorted_list=sorted(state_list, key=lambda st: st.name)
+        joint_name = ''
+        for st in sorted_list:
+            joint_name += st.name
+        return joint_name
 
     def to_minimized(
         self,
+        algorithm: str = "hopcroft",
     ) -> "FiniteAutomaton":
         """
         Return a equivalent minimal automaton.
 
+        Args:
+            algorithm: Minimization algorithm. ``"hopcroft"`` for Hopcroft's
+                partition refinement, ``"brzozowski"`` for determinizing the
+                reverse automaton twice (the automaton does not need to be
+                deterministic), or ``"table"`` for the table-filling
+                algorithm, kept as a reference implementation.
+
         Returns:
             Equivalent minimal automaton.
 
         """
-        accesibles, new_transitions = self._get_accesibles(self.initial_state, self.transitions)
-        initial_state, new_states, new_transitions = self._get_equivalente(accesibles, new_transitions)
+        if algorithm == "brzozowski":
+            return self._reverse_deterministic()._reverse_deterministic()
+
+        accesibles, new_transitions = self._get_accesibles(self.initial_state)
+        if algorithm == "hopcroft":
+            initial_state, new_states, new_transitions = self._get_equivalente_hopcroft(accesibles)
+        elif algorithm == "table":
+            initial_state, new_states, new_transitions = self._get_equivalente(accesibles, new_transitions)
+        else:
+            raise ValueError(f"Unknown minimization algorithm {algorithm}")
         #print("Initial state: ", initial_state)
         #print("New states: ", new_states)
         #print("New transitions: ", new_transitions)
         return FiniteAutomaton(initial_state=initial_state, states=new_states,
-                                symbols=self.symbols, transitions=new_transitions)
+                                symbols=self.symbols, transitions=new_transitions,
+                                validate=False)
 
 
     def _get_accesibles(
         self,
         initial_state: State,
-        transitions: Collection[Transition]
     ) -> Tuple[Collection[State], Collection[Transition]]:
         """
         Devuelve los estados accesibles (y sus transiciones) dado un estado inicial.
@@ -202,19 +732,27 @@ class FiniteAutomaton(
 
         """
         accesibles = [initial_state]
+        set_accesibles = {initial_state}
         i = 0
         # Iteramos mientras encontremos estados accesibles
         while i < len(accesibles):
-            for tr in transitions:
-                if tr.initial_state == accesibles[i]:
-                    if tr.final_state not in accesibles:
-                        accesibles.append(tr.final_state)
+            st = accesibles[i]
+            targets = [
+                *self.successors(st, None),
+                *(t for ts in self.outgoing(st).values() for t in ts),
+            ]
+            for target in targets:
+                if target not in set_accesibles:
+                    set_accesibles.add(target)
+                    accesibles.append(target)
             i+=1
 
-        # Guardamos las transiciones que implican a los accesibles
+        # Guardamos las transiciones que implican a los accesibles (basta con
+        # mirar el origen, pues el destino de una transicion desde un
+        # accesible tambien lo es)
         new_transitions = []
-        for tr in transitions:
-            if tr.initial_state in accesibles and tr.final_state in accesibles:
+        for tr in self.transitions:
+            if tr.initial_state in set_accesibles:
                 new_transitions.append(tr)
 
         return accesibles, new_transitions
@@ -332,3 +870,112 @@ class FiniteAutomaton(
                     new_transitions.add(Transition(new_states_dic[tr.initial_state], tr.symbol, new_states_dic[tr.final_state]))
 
         return initial_state, new_states, new_transitions
+
+    def _get_equivalente_hopcroft(
+        self,
+        states: Collection[State],
+    ) -> Tuple[State, Collection[State], Collection[Transition]]:
+        """
+        Devuelve los datos necesarios para crear un automata equivalente,
+        calculando las clases de equivalencia con el algoritmo de Hopcroft.
+
+        Las transiciones que faltan van a un sumidero virtual (el indice
+        len(states)), que no aparece en el automata resultante.
+
+        Returns:
+            Tupla con estado inicial, lista de estados y lista de transiciones
+            del automata equivalente.
+
+        """
+        sorted_list = sorted(states, key=lambda st: st.name)
+        ids = {st: i for i, st in enumerate(sorted_list)}
+        sink = len(sorted_list)
+
+        # Transiciones inversas {simbolo: [origenes de cada estado destino]}
+        inverse: Dict[str, List[List[int]]] = {
+            symbol: [[] for _ in range(sink + 1)] for symbol in self.symbols
+        }
+        for i, st in enumerate(sorted_list):
+            if self.successors(st, None):
+                raise ValueError("Automaton is not deterministic")
+            outgoing = self.outgoing(st)
+            for symbol in self.symbols:
+                targets = outgoing.get(symbol, ())
+                if len(targets) > 1:
+                    raise ValueError("Automaton is not deterministic")
+                inverse[symbol][ids[targets[0]] if targets else sink].append(i)
+        for symbol in self.symbols:
+            inverse[symbol][sink].append(sink)
+
+        # Particion inicial: finales y no finales (con el sumidero)
+        finals = {i for i, st in enumerate(sorted_list) if st.is_final}
+        blocks = [b for b in (finals, set(range(sink + 1)) - finals) if b]
+        block_of = [0] * (sink + 1)
+        for b, block in enumerate(blocks):
+            for i in block:
+                block_of[i] = b
+
+        # Pares (bloque, simbolo) pendientes de usar como separadores
+        smallest = min(range(len(blocks)), key=lambda b: len(blocks[b]))
+        pending = [(smallest, symbol) for symbol in self.symbols]
+        in_pending = set(pending)
+        while pending:
+            splitter = pending.pop()
+            in_pending.discard(splitter)
+            b, symbol = splitter
+
+            # Estados que llegan al bloque con el simbolo, agrupados por bloque
+            touched: Dict[int, Set[int]] = {}
+            for target in blocks[b]:
+                for i in inverse[symbol][target]:
+                    touched.setdefault(block_of[i], set()).add(i)
+
+            for y, inside in touched.items():
+                if len(inside) == len(blocks[y]):
+                    continue
+
+                # Partimos el bloque y en inside y el resto
+                blocks[y] -= inside
+                new_block = len(blocks)
+                blocks.append(inside)
+                for i in inside:
+                    block_of[i] = new_block
+
+                for s in self.symbols:
+                    if (y, s) in in_pending:
+                        added = (new_block, s)
+                    elif len(inside) < len(blocks[y]):
+                        added = (new_block, s)
+                    else:
+                        added = (y, s)
+                    pending.append(added)
+                    in_pending.add(added)
+
+        # Un estado nuevo por bloque con algun estado real
+        new_states_list: List[Optional[State]] = []
+        for block in blocks:
+            members = [sorted_list[i] for i in sorted(block) if i != sink]
+            if members:
+                new_states_list.append(State(
+                    self._joint_name(members),
+                    is_final=members[0].is_final,
+                ))
+            else:
+                new_states_list.append(None)
+
+        new_transitions = set()
+        for i, st in enumerate(sorted_list):
+            new_state = new_states_list[block_of[i]]
+            assert new_state is not None
+            for symbol, targets in self.outgoing(st).items():
+                target_state = new_states_list[block_of[ids[targets[0]]]]
+                assert target_state is not None
+                new_transitions.add(
+                    Transition(new_state, symbol, target_state),
+                )
+
+        initial_state = new_states_list[block_of[ids[self.initial_state]]]
+        assert initial_state is not None
+        new_states = {st for st in new_states_list if st is not None}
+
+        return initial_state, new_states, new_transitions
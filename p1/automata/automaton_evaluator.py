@@ -1,5 +1,6 @@
 """Evaluation of automata."""
-from typing import Set
+from collections import OrderedDict
+from typing import AbstractSet, Dict, FrozenSet, Iterator, List, Set, Tuple
 
 from automata.automaton import FiniteAutomaton, State
 from automata.interfaces import AbstractFiniteAutomatonEvaluator
@@ -28,16 +29,14 @@ class FiniteAutomatonEvaluator(
             symbol: Symbol to consume.
 
         """
-        new_states = set()
+        new_states: Set[State] = set()
         # Comprobamos que el simbolo es válido
         if symbol in self.automaton.symbols:
             # Recorremos los estados (st) y transiciones (tr) para buscar:
             # tr: st -symbol-> final_state
             # Y anadir final_state a current_states y calcular sus trans lambda
             for st in self.current_states:
-                for tr in self.automaton.transitions:
-                    if tr.initial_state == st and tr.symbol == symbol:
-                        new_states.add(tr.final_state)
+                new_states.update(self.automaton.successors(st, symbol))
         else:
             raise ValueError('Símbolo no recogido en el alfabeto')
 
@@ -54,18 +53,7 @@ class FiniteAutomatonEvaluator(
         Args:
             set_to_complete: Current set of states to be completed.
         """
-        # Creamos una lista que sera la clausura lambda
-        list_to_complete = list(set_to_complete)
-        length_list = len(list_to_complete)
-        i = 0
-        # Mientras encontremos nuevos estados buscamos sus trans lambda y las anadimos
-        while(i < length_list):
-            for tr in self.automaton.transitions:
-                if tr.initial_state == list_to_complete[i] and tr.symbol == None and not tr.final_state in set_to_complete:
-                    set_to_complete.add(tr.final_state)
-                    list_to_complete.append(tr.final_state)
-                    length_list += 1
-            i += 1
+        set_to_complete.update(self.automaton.epsilon_closure(set_to_complete))
 
     def is_accepting(self) -> bool:
         """Check if the current state is an accepting one."""
@@ -73,3 +61,334 @@ class FiniteAutomatonEvaluator(
             if(state.is_final):
                 return True
         return False
+
+    def is_dead(self) -> bool:
+        """Check if no continuation of the input can be accepted."""
+        return self.automaton.live_states().isdisjoint(self.current_states)
+
+
+class BitsetFiniteAutomatonEvaluator(FiniteAutomatonEvaluator):
+    """
+    Evaluator of an automaton that simulates it as an NFA over bitmasks.
+
+    The set of current states is kept as an integer whose bit ``i`` is the
+    ``i``-th state of ``automaton.states``. The lambda closure of every state
+    and the (closed) successors of every state with every symbol are
+    precomputed as masks, so processing a symbol is just OR-ing the masks of
+    the active states. Each mask can have as many bits as the automaton has
+    states, so these tables grow quadratically with the number of states.
+
+    """
+
+    current_mask: int
+
+    def __init__(
+        self,
+        automaton: FiniteAutomaton
+    ) -> None:
+        self._states = tuple(automaton.states)
+        self._index = {st: i for i, st in enumerate(self._states)}
+
+        # Clausura lambda de cada estado como mascara
+        self._closures = self._closure_masks(automaton)
+
+        # {simbolo: mascara de sucesores (con su clausura) de cada estado}
+        self._successors: Dict[str, List[int]] = {
+            symbol: [0] * len(self._states) for symbol in automaton.symbols
+        }
+        # {simbolo: mascara de estados con alguna transicion con el simbolo}
+        self._active: Dict[str, int] = dict.fromkeys(automaton.symbols, 0)
+        for i, st in enumerate(self._states):
+            for symbol, targets in automaton.outgoing(st).items():
+                mask = 0
+                for target in targets:
+                    mask |= self._closures[self._index[target]]
+                self._successors[symbol][i] = mask
+                self._active[symbol] |= 1 << i
+
+        self._final_mask = self._encode(
+            {st for st in self._states if st.is_final},
+        )
+
+        # Estados desde los que se puede llegar a un final
+        self._live_mask = self._encode(automaton.live_states())
+
+        self.current_mask = 0
+        super().__init__(
+            automaton = automaton
+        )
+
+    def _closure_masks(self, automaton: FiniteAutomaton) -> List[int]:
+        """
+        Calcula la clausura lambda de todos los estados como mascaras.
+
+        Usa el algoritmo de Tarjan sobre el grafo de transiciones lambda: los
+        estados de una misma componente fuertemente conexa comparten
+        clausura, y las componentes salen en orden topologico inverso, por lo
+        que la clausura de una componente es la union de sus estados y las
+        clausuras (ya calculadas) de las componentes a las que llega.
+
+        Returns:
+            Lista con la mascara de la clausura de cada estado.
+
+        """
+        closures = [0] * len(self._states)
+        index: Dict[int, int] = {}
+        low: Dict[int, int] = {}
+        stack: List[int] = []
+        on_stack = set()
+
+        def lambda_targets(i: int) -> Iterator[int]:
+            """Recorre las posiciones de los destinos lambda de un estado."""
+            for target in automaton.successors(self._states[i], None):
+                yield self._index[target]
+
+        for root in range(len(self._states)):
+            if root in index:
+                continue
+
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, lambda_targets(root))]
+            while work:
+                i, pending = work[-1]
+                # Avanzamos en profundidad por el primer sucesor no visitado
+                for j in pending:
+                    if j not in index:
+                        index[j] = low[j] = len(index)
+                        stack.append(j)
+                        on_stack.add(j)
+                        work.append((j, lambda_targets(j)))
+                        break
+                    if j in on_stack:
+                        low[i] = min(low[i], index[j])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[i])
+
+                    # i es la raiz de una componente: la sacamos de la pila
+                    if low[i] == index[i]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == i:
+                                break
+
+                        mask = 0
+                        for member in component:
+                            mask |= 1 << member
+                            for j in lambda_targets(member):
+                                mask |= closures[j]
+                        for member in component:
+                            closures[member] = mask
+
+        return closures
+
+    @property
+    def current_states(self) -> AbstractSet[State]:
+        """Set of current states of the automata."""
+        return self._decode(self.current_mask)
+
+    @current_states.setter
+    def current_states(self, states: AbstractSet[State]) -> None:
+        self.current_mask = self._encode(states)
+
+    def _encode(self, states: AbstractSet[State]) -> int:
+        """
+        Devuelve la mascara de un conjunto de estados.
+
+        Returns:
+            Entero con el bit de cada estado del conjunto a 1.
+
+        """
+        mask = 0
+        for st in states:
+            mask |= 1 << self._index[st]
+        return mask
+
+    def _decode(self, mask: int) -> Set[State]:
+        """
+        Devuelve el conjunto de estados de una mascara.
+
+        Returns:
+            Conjunto con los estados cuyo bit esta a 1.
+
+        """
+        states = set()
+        while mask:
+            low = mask & -mask
+            states.add(self._states[low.bit_length() - 1])
+            mask ^= low
+        return states
+
+    def process_symbol(self, symbol: str) -> None:
+        """
+        Process one symbol.
+
+        Args:
+            symbol: Symbol to consume.
+
+        """
+        successors = self._successors.get(symbol)
+        if successors is None:
+            raise ValueError('Símbolo no recogido en el alfabeto')
+
+        # Solo miramos los estados activos con transiciones con el simbolo
+        mask = self.current_mask & self._active[symbol]
+        new_mask = 0
+        while mask:
+            low = mask & -mask
+            new_mask |= successors[low.bit_length() - 1]
+            mask ^= low
+
+        self.current_mask = new_mask
+
+    def _complete_lambdas(self, set_to_complete: Set[State]) -> None:
+        """
+        Add states reachable with lambda transitions to the set.
+
+        Args:
+            set_to_complete: Current set of states to be completed.
+        """
+        mask = 0
+        for st in set_to_complete:
+            mask |= self._closures[self._index[st]]
+        set_to_complete.update(self._decode(mask))
+
+    def is_accepting(self) -> bool:
+        """Check if the current state is an accepting one."""
+        return bool(self.current_mask & self._final_mask)
+
+    def is_dead(self) -> bool:
+        """Check if no continuation of the input can be accepted."""
+        return not self.current_mask & self._live_mask
+
+    def accepts(self, string: str) -> bool:
+        """
+        Return if a string is accepted without changing state.
+
+        Note: This function is NOT thread-safe.
+
+        """
+        old_mask = self.current_mask
+        try:
+            self.process_string(string)
+            accepted = self.is_accepting()
+        finally:
+            self.current_mask = old_mask
+
+        return accepted
+
+
+_CacheEntry = Tuple[Dict[str, FrozenSet[State]], bool]
+
+
+class LazyFiniteAutomatonEvaluator(
+    AbstractFiniteAutomatonEvaluator[FiniteAutomaton, State],
+):
+    """
+    Evaluator of an automaton that determinizes it on the fly.
+
+    Each set of current states is a state of the equivalent deterministic
+    automaton, but those states and their transitions are only computed
+    when the input reaches them. They are kept in a LRU cache of at most
+    ``cache_size`` states, so automata whose full determinization is too big
+    can be evaluated with bounded memory: evicted states are computed again
+    if the input comes back to them.
+
+    Args:
+        automaton: Automaton to evaluate.
+        cache_size: Maximum number of deterministic states in the cache.
+
+    """
+
+    current_states: FrozenSet[State]
+
+    def __init__(
+        self,
+        automaton: FiniteAutomaton,
+        cache_size: int = 1024,
+    ) -> None:
+        if cache_size < 1:
+            raise ValueError("The cache must hold at least one state")
+
+        self.cache_size = cache_size
+        self._symbols = frozenset(automaton.symbols)
+        # {estados actuales: ({simbolo: estados siguientes}, es final)}
+        self._cache: "OrderedDict[FrozenSet[State], _CacheEntry]" = (
+            OrderedDict()
+        )
+        super().__init__(
+            automaton = automaton
+        )
+        self.current_states = frozenset(self.current_states)
+
+    def _cached(
+        self,
+        states: FrozenSet[State],
+    ) -> _CacheEntry:
+        """
+        Devuelve la entrada de la cache de un estado del determinista,
+        creandola (y echando la usada hace mas tiempo si no cabe) si hace
+        falta.
+
+        Returns:
+            Tupla con las transiciones ya calculadas desde el estado y si es
+            final.
+
+        """
+        entry = self._cache.get(states)
+        if entry is None:
+            entry = ({}, any(st.is_final for st in states))
+            self._cache[states] = entry
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(states)
+        return entry
+
+    def process_symbol(self, symbol: str) -> None:
+        """
+        Process one symbol.
+
+        Args:
+            symbol: Symbol to consume.
+
+        """
+        if symbol not in self._symbols:
+            raise ValueError('Símbolo no recogido en el alfabeto')
+
+        transitions, _ = self._cached(self.current_states)
+        new_states = transitions.get(symbol)
+        if new_states is None:
+            new_states = self.automaton.epsilon_closure(
+                target
+                for st in self.current_states
+                for target in self.automaton.successors(st, symbol)
+            )
+            transitions[symbol] = new_states
+
+        self.current_states = new_states
+
+    def _complete_lambdas(self, set_to_complete: Set[State]) -> None:
+        """
+        Add states reachable with lambda transitions to the set.
+
+        Args:
+            set_to_complete: Current set of states to be completed.
+        """
+        set_to_complete.update(self.automaton.epsilon_closure(set_to_complete))
+
+    def is_accepting(self) -> bool:
+        """Check if the current state is an accepting one."""
+        _, accepting = self._cached(self.current_states)
+        return accepting
+
+    def is_dead(self) -> bool:
+        """Check if no continuation of the input can be accepted."""
+        return self.automaton.live_states().isdisjoint(self.current_states)
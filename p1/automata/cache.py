@@ -0,0 +1,127 @@
+"""Process-wide cache of the automata built from regular expressions."""
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Tuple
+
+from automata.automaton import FiniteAutomaton
+from automata.compact import CompactAutomaton
+from automata.re_parser import REParser
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a :class:`RegexCache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class RegexCache():
+    """
+    Size-bounded LRU cache of the automata built from regular expressions.
+
+    The automata are kept in compact form and every call decodes a new
+    automaton, so the automata handed out can be modified (e.g.
+    :meth:`FiniteAutomaton.to_deterministic` sets the ``sumidero`` of its
+    source) without affecting the cache or other callers.
+
+    Args:
+        maxsize: Maximum number of automata in the cache.
+
+    """
+
+    maxsize: int
+    hits: int
+    misses: int
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize < 1:
+            raise ValueError("The cache must hold at least one automaton")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[Tuple[str, str], CompactAutomaton]" = (
+            OrderedDict()
+        )
+
+    def _get(self, key: Tuple[str, str]) -> FiniteAutomaton:
+        """
+        Devuelve el automata de una entrada, construyendolo y guardandolo si
+        no estaba (echando el usado hace mas tiempo si no cabe).
+
+        Returns:
+            Copia nueva del automata de la entrada.
+
+        """
+        with self._lock:
+            compact = self._cache.get(key)
+            if compact is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if compact is None:
+            kind, re_string = key
+            automaton = REParser().create_automaton(re_string)
+            if kind == "minimized":
+                automaton = automaton.to_deterministic().to_minimized()
+            compact = CompactAutomaton.from_automaton(automaton)
+
+            with self._lock:
+                self._cache[key] = compact
+                if len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+
+        return compact.to_automaton()
+
+    def create_automaton(self, re_string: str) -> FiniteAutomaton:
+        """
+        Create an automaton from a regex, reusing a previous one if possible.
+
+        Args:
+            re_string: String with the regular expression in Kleene notation.
+
+        Returns:
+            Automaton equivalent to the regex.
+
+        """
+        return self._get(("automaton", re_string))
+
+    def create_minimized(self, re_string: str) -> FiniteAutomaton:
+        """
+        Create the minimal deterministic automaton of a regex, reusing a
+        previous one if possible.
+
+        Args:
+            re_string: String with the regular expression in Kleene notation.
+
+        Returns:
+            Minimal deterministic automaton equivalent to the regex.
+
+        """
+        return self._get(("minimized", re_string))
+
+    def info(self) -> CacheInfo:
+        """Return the statistics of the cache."""
+        with self._lock:
+            return CacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                maxsize=self.maxsize,
+                currsize=len(self._cache),
+            )
+
+    def clear(self) -> None:
+        """Remove every automaton and reset the statistics."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+regex_cache = RegexCache()
+"""Cache shared by the whole process."""
@@ -0,0 +1,245 @@
+"""Compact, integer-encoded representation of automata."""
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Sequence
+
+from typing_extensions import Final
+
+from automata.automaton import FiniteAutomaton, State, Transition
+
+LAMBDA: Final = -1
+"""Label used for lambda transitions in :class:`CompactAutomaton`."""
+
+
+class CompactAutomaton():
+    """
+    Array-backed representation of a finite automaton.
+
+    States are numbered ``0..n-1`` and symbols ``0..k-1``. Transitions are
+    stored in CSR form: the transitions leaving state ``i`` are the
+    positions ``offsets[i]:offsets[i + 1]`` of ``labels`` (symbol number, or
+    :data:`LAMBDA`) and ``targets`` (destination state), sorted by label.
+
+    Args:
+        state_names: Name of each state.
+        symbols: Symbols of the automaton.
+        initial_state: Number of the initial state.
+        final: Bitmap of final states (bit ``i % 8`` of byte ``i // 8``).
+        offsets: Start of the transitions of each state (``n + 1`` items).
+        labels: Symbol of each transition.
+        targets: Destination state of each transition.
+
+    """
+
+    state_names: Sequence[str]
+    symbols: Sequence[str]
+    initial_state: int
+    final: Sequence[int]
+    offsets: Sequence[int]
+    labels: Sequence[int]
+    targets: Sequence[int]
+    symbol_ids: Dict[str, int]
+
+    def __init__(
+        self,
+        *,
+        state_names: Sequence[str],
+        symbols: Sequence[str],
+        initial_state: int,
+        final: Sequence[int],
+        offsets: Sequence[int],
+        labels: Sequence[int],
+        targets: Sequence[int],
+    ) -> None:
+        num_states = len(state_names)
+        if not 0 <= initial_state < num_states:
+            raise ValueError(
+                f"Initial state {initial_state} is not in the set of states",
+            )
+
+        if len(offsets) != num_states + 1:
+            raise ValueError("There must be one offset per state plus one")
+
+        if len(final) != (num_states + 7) // 8:
+            raise ValueError("The final bitmap does not match the states")
+
+        if len(labels) != len(targets) or offsets[-1] != len(targets):
+            raise ValueError("The transition arrays do not match")
+
+        self.state_names = state_names
+        self.symbols = symbols
+        self.initial_state = initial_state
+        self.final = final
+        self.offsets = offsets
+        self.labels = labels
+        self.targets = targets
+        self.symbol_ids = {s: i for i, s in enumerate(symbols)}
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"states={len(self.state_names)!r}, "
+            f"symbols={len(self.symbols)!r}, "
+            f"transitions={len(self.targets)!r})"
+        )
+
+    @property
+    def num_states(self) -> int:
+        """Number of states."""
+        return len(self.state_names)
+
+    def is_final(self, state: int) -> bool:
+        """
+        Check if a state is final.
+
+        Args:
+            state: Number of the state.
+
+        Returns:
+            ``True`` if the state is final. ``False`` otherwise.
+
+        """
+        return bool(self.final[state >> 3] & (1 << (state & 7)))
+
+    def successors(self, state: int, symbol: int) -> List[int]:
+        """
+        Return the states reached from a state with one transition.
+
+        Args:
+            state: Number of the source state.
+            symbol: Number of the symbol consumed, or :data:`LAMBDA`.
+
+        Returns:
+            Numbers of the states reached.
+
+        """
+        labels = self.labels
+        targets = self.targets
+        return [
+            targets[i]
+            for i in range(self.offsets[state], self.offsets[state + 1])
+            if labels[i] == symbol
+        ]
+
+    def step(self, state: int, symbol: int) -> int:
+        """
+        Return the state reached from a state of a deterministic automaton.
+
+        Args:
+            state: Number of the source state.
+            symbol: Number of the symbol consumed.
+
+        Returns:
+            Number of the state reached, or ``-1`` if there is no transition.
+
+        """
+        # Las transiciones de cada estado estan ordenadas por simbolo
+        end = self.offsets[state + 1]
+        i = bisect_left(self.labels, symbol, self.offsets[state], end)
+        if i < end and self.labels[i] == symbol:
+            return self.targets[i]
+        return -1
+
+    def accepts(self, string: str) -> bool:
+        """
+        Return if a string is accepted by a deterministic automaton.
+
+        Args:
+            string: String to check.
+
+        Returns:
+            ``True`` if the string is accepted. ``False`` otherwise.
+
+        """
+        symbol_ids = self.symbol_ids
+        state = self.initial_state
+        for symbol in string:
+            symbol_id = symbol_ids.get(symbol)
+            if symbol_id is None:
+                raise ValueError('Símbolo no recogido en el alfabeto')
+            if state >= 0:
+                state = self.step(state, symbol_id)
+        return state >= 0 and self.is_final(state)
+
+    @classmethod
+    def from_automaton(cls, automaton: FiniteAutomaton) -> "CompactAutomaton":
+        """
+        Encode an automaton.
+
+        Args:
+            automaton: Automaton to encode.
+
+        Returns:
+            Compact representation of the automaton.
+
+        """
+        state_ids = {st: i for i, st in enumerate(automaton.states)}
+        symbol_ids = {s: i for i, s in enumerate(automaton.symbols)}
+        num_states = len(state_ids)
+
+        # Agrupamos las transiciones por estado origen
+        edges: List[List[int]] = [[] for _ in range(num_states)]
+        for tr in automaton.transitions:
+            label = LAMBDA if tr.symbol is None else symbol_ids[tr.symbol]
+            edges[state_ids[tr.initial_state]].append(
+                (label << 32) | state_ids[tr.final_state],
+            )
+
+        offsets = array("i", [0])
+        labels = array("i")
+        targets = array("i")
+        for state_edges in edges:
+            # Codificamos (simbolo, destino) en un entero para ordenar rapido
+            state_edges.sort()
+            for edge in state_edges:
+                labels.append(edge >> 32)
+                targets.append(edge & 0xFFFFFFFF)
+            offsets.append(len(targets))
+
+        final = bytearray((num_states + 7) // 8)
+        for st, i in state_ids.items():
+            if st.is_final:
+                final[i >> 3] |= 1 << (i & 7)
+
+        return cls(
+            state_names=tuple(st.name for st in automaton.states),
+            symbols=tuple(automaton.symbols),
+            initial_state=state_ids[automaton.initial_state],
+            final=final,
+            offsets=offsets,
+            labels=labels,
+            targets=targets,
+        )
+
+    def to_automaton(self) -> FiniteAutomaton:
+        """
+        Decode the automaton.
+
+        Returns:
+            Equivalent automaton in the object representation.
+
+        """
+        states = [
+            State(name, is_final=self.is_final(i))
+            for i, name in enumerate(self.state_names)
+        ]
+
+        transitions = []
+        offsets = self.offsets
+        labels = self.labels
+        targets = self.targets
+        for i, st in enumerate(states):
+            for j in range(offsets[i], offsets[i + 1]):
+                label = labels[j]
+                transitions.append(Transition(
+                    st,
+                    None if label == LAMBDA else self.symbols[label],
+                    states[targets[j]],
+                ))
+
+        return FiniteAutomaton(
+            initial_state=states[self.initial_state],
+            states=states,
+            symbols=self.symbols,
+            transitions=transitions,
+        )
@@ -0,0 +1,275 @@
+"""Compiled matchers for deterministic automata."""
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+import numpy.typing as npt
+from typing_extensions import Final
+
+from automata.automaton import FiniteAutomaton
+from automata.compact import LAMBDA, CompactAutomaton
+
+PAD: Final = -1
+"""Symbol code used to pad the rows of an encoded batch of strings."""
+
+_DEAD_CHECK_INTERVAL: Final = 8
+
+
+class CompiledDFA():
+    """
+    Immutable matcher for a deterministic automaton.
+
+    Args:
+        symbols: Symbols of the automaton, in column order.
+        initial_state: Number of the initial state.
+        table: ``n_states x n_symbols`` transition table. Missing
+            transitions are stored as ``-1``.
+        accept: Whether each state is final.
+
+    """
+
+    symbols: Sequence[str]
+    initial_state: int
+    table: npt.NDArray[np.int32]
+    accept: npt.NDArray[np.bool_]
+
+    def __init__(
+        self,
+        *,
+        symbols: Sequence[str],
+        initial_state: int,
+        table: npt.NDArray[np.int32],
+        accept: npt.NDArray[np.bool_],
+    ) -> None:
+        if table.ndim != 2 or table.shape != (len(accept), len(symbols)):
+            raise ValueError("The table does not match states and symbols")
+
+        if not 0 <= initial_state < len(accept):
+            raise ValueError(
+                f"Initial state {initial_state} is not in the set of states",
+            )
+
+        self.symbols = tuple(symbols)
+        self.initial_state = initial_state
+        self.table = np.array(table, dtype=np.int32)
+        self.accept = np.array(accept, dtype=np.bool_)
+        self.table.setflags(write=False)
+        self.accept.setflags(write=False)
+
+        # Copia en listas de Python para el bucle de accepts, con una fila
+        # extra (la ultima) que hace de sumidero para las transiciones -1
+        num_states = len(self.accept)
+        self._columns: Dict[str, int] = {
+            s: i for i, s in enumerate(self.symbols)
+        }
+        self._rows: List[List[int]] = [
+            [num_states if t < 0 else t for t in row]
+            for row in self.table.tolist()
+        ]
+        self._rows.append([num_states] * len(self.symbols))
+        self._accept: List[bool] = self.accept.tolist() + [False]
+
+        # Tablas para accepts_batch: misma fila sumidero y una columna extra
+        # (la ultima, a la que apunta PAD = -1) que deja el estado igual
+        self._batch_table = np.array(self._rows, dtype=np.int32).reshape(
+            num_states + 1, len(self.symbols),
+        )
+        self._batch_table = np.hstack((
+            self._batch_table,
+            np.arange(num_states + 1, dtype=np.int32)[:, None],
+        ))
+        self._batch_accept = np.append(self.accept, False)
+
+        # Estados vivos (desde los que se llega a un final), recorriendo la
+        # tabla hacia atras. El sumidero no lo esta
+        predecessors: List[List[int]] = [[] for _ in range(num_states + 1)]
+        for i, row in enumerate(self._rows):
+            for target in row:
+                predecessors[target].append(i)
+        live = self._accept.copy()
+        pending = [i for i, accepting in enumerate(live) if accepting]
+        while pending:
+            for i in predecessors[pending.pop()]:
+                if not live[i]:
+                    live[i] = True
+                    pending.append(i)
+        self._dead: List[bool] = [not is_live for is_live in live]
+        self._batch_live = np.array(live, dtype=np.bool_)
+
+        # Puntos de codigo de los simbolos ordenados, para codificar
+        # cadenas con searchsorted
+        single = [s for s in self.symbols if len(s) == 1]
+        order = np.argsort([ord(s) for s in single]).astype(np.int32)
+        self._code_points = np.array(
+            [ord(single[i]) for i in order], dtype=np.uint32,
+        )
+        self._point_codes = np.array(
+            [self._columns[single[i]] for i in order], dtype=np.int32,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"states={len(self.accept)!r}, "
+            f"symbols={self.symbols!r})"
+        )
+
+    @classmethod
+    def from_automaton(cls, automaton: FiniteAutomaton) -> "CompiledDFA":
+        """
+        Compile a deterministic automaton.
+
+        Args:
+            automaton: Deterministic automaton to compile.
+
+        Returns:
+            Compiled matcher.
+
+        """
+        return cls.from_compact(CompactAutomaton.from_automaton(automaton))
+
+    @classmethod
+    def from_compact(cls, compact: CompactAutomaton) -> "CompiledDFA":
+        """
+        Compile a deterministic automaton in compact form.
+
+        Args:
+            compact: Deterministic automaton to compile.
+
+        Returns:
+            Compiled matcher.
+
+        """
+        num_states = compact.num_states
+        table = np.full((num_states, len(compact.symbols)), -1, dtype=np.int32)
+        for i in range(num_states):
+            for j in range(compact.offsets[i], compact.offsets[i + 1]):
+                label = compact.labels[j]
+                if label == LAMBDA:
+                    raise ValueError("Automaton is not deterministic")
+                if table[i, label] >= 0:
+                    raise ValueError("Automaton is not deterministic")
+                table[i, label] = compact.targets[j]
+
+        accept = np.array(
+            [compact.is_final(i) for i in range(num_states)],
+            dtype=np.bool_,
+        )
+
+        return cls(
+            symbols=compact.symbols,
+            initial_state=compact.initial_state,
+            table=table,
+            accept=accept,
+        )
+
+    def encode(self, strings: Sequence[str]) -> npt.NDArray[np.int32]:
+        """
+        Encode a batch of strings as symbol codes.
+
+        Args:
+            strings: Strings to encode.
+
+        Returns:
+            ``len(strings) x max_length`` matrix with the column of each
+            symbol in the table, padded at the end of each row with
+            :data:`PAD`.
+
+        """
+        lengths = np.fromiter(
+            (len(s) for s in strings), dtype=np.int64, count=len(strings),
+        )
+        max_length = int(lengths.max()) if len(strings) else 0
+        codes = np.full((len(strings), max_length), PAD, dtype=np.int32)
+
+        points = np.frombuffer(
+            "".join(strings).encode("utf-32-le"), dtype=np.uint32,
+        )
+        if not len(points):
+            return codes
+
+        if not len(self._code_points):
+            raise ValueError('Símbolo no recogido en el alfabeto')
+
+        positions = np.searchsorted(self._code_points, points)
+        positions = np.minimum(positions, len(self._code_points) - 1)
+        if not np.array_equal(self._code_points[positions], points):
+            raise ValueError('Símbolo no recogido en el alfabeto')
+
+        # La mascara se recorre por filas, en el mismo orden que la cadena
+        # concatenada
+        codes[np.arange(max_length) < lengths[:, None]] = (
+            self._point_codes[positions]
+        )
+        return codes
+
+    def accepts_batch(
+        self,
+        strings: Union[Sequence[str], npt.NDArray[np.integer]],
+    ) -> npt.NDArray[np.bool_]:
+        """
+        Return which strings of a batch are accepted.
+
+        All the strings advance one symbol at a time together, looking up
+        the next state of the whole batch with a single gather. It stops
+        early once every string is in a state that cannot reach a final one.
+
+        Args:
+            strings: Strings to check, or a matrix of symbol codes padded
+                with :data:`PAD` as returned by :meth:`encode`.
+
+        Returns:
+            Boolean mask with ``True`` for the accepted strings.
+
+        """
+        if isinstance(strings, np.ndarray):
+            codes = strings
+            if codes.ndim != 2:
+                raise ValueError("Symbol codes must be a 2D matrix")
+            if codes.size and (
+                codes.min() < PAD or codes.max() >= len(self.symbols)
+            ):
+                raise ValueError('Símbolo no recogido en el alfabeto')
+        else:
+            codes = self.encode(strings)
+
+        # Recorremos por columnas, asi que las guardamos contiguas
+        codes = np.asfortranarray(codes, dtype=np.intp)
+        table = self._batch_table
+        live = self._batch_live
+        states = np.full(len(codes), self.initial_state, dtype=np.intp)
+        for i, column in enumerate(codes.T):
+            states = table[states, column]
+            # De vez en cuando comprobamos si ya estan todas rechazadas
+            if i % _DEAD_CHECK_INTERVAL == 0 and not live[states].any():
+                break
+
+        return self._batch_accept[states]
+
+    def accepts(self, string: str) -> bool:
+        """
+        Return if a string is accepted.
+
+        Args:
+            string: String to check.
+
+        Returns:
+            ``True`` if the string is accepted. ``False`` otherwise.
+
+        """
+        rows = self._rows
+        columns = self._columns
+        dead = self._dead
+        state = self.initial_state
+        symbols = iter(string)
+        try:
+            for symbol in symbols:
+                state = rows[state][columns[symbol]]
+                if dead[state]:
+                    # Solo falta comprobar que el resto esta en el alfabeto
+                    if not columns.keys() >= set(symbols):
+                        raise ValueError('Símbolo no recogido en el alfabeto')
+                    return False
+        except KeyError as e:
+            raise ValueError('Símbolo no recogido en el alfabeto') from e
+
+        return self._accept[state]
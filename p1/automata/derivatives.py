@@ -0,0 +1,357 @@
+"""Conversion from regex to deterministic automata with derivatives."""
+from collections import deque
+from typing import Deque, Dict, List, Sequence, Set, Tuple
+
+from typing_extensions import Final
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.re_parser_interfaces import _re_to_rpn
+
+EMPTY: Final = 0
+LAMBDA: Final = 1
+SYMBOL: Final = 2
+CONCAT: Final = 3
+UNION: Final = 4
+STAR: Final = 5
+
+
+class RegexDerivatives():
+    """
+    Regular expression in Kleene's syntax handled through its derivatives.
+
+    The derivative of an expression with respect to a symbol accepts the
+    strings ``w`` such that the symbol followed by ``w`` is accepted by the
+    expression. Expressions are hash-consed (each distinct expression is a
+    single integer id) and normalized by the constructors, so that the
+    derivatives of an expression are finitely many. Every derivative is
+    computed at most once.
+
+    Args:
+        re_string: String with the regular expression in Kleene notation.
+
+    Attributes:
+        root: Id of the expression.
+        symbols: Symbols that appear in the expression.
+
+    """
+
+    root: int
+    symbols: Tuple[str, ...]
+
+    def __init__(self, re_string: str) -> None:
+        # Nodo de cada id: (tipo, argumentos) y el inverso para hash-consing
+        self._nodes: List[Tuple[int, Tuple[int, ...]]] = []
+        self._ids: Dict[Tuple[int, Tuple[int, ...]], int] = {}
+        self._nullable: List[bool] = []
+        self._derivatives: Dict[Tuple[int, str], int] = {}
+
+        self._empty = self._node(EMPTY, (), nullable=False)
+        self._lambda = self._node(LAMBDA, (), nullable=True)
+
+        symbols: Dict[str, None] = {}
+        # Las concatenaciones se guardan como la lista de sus operandos y
+        # solo se construyen cuando hace falta el nodo, para no recorrer la
+        # cadena entera en cada "."
+        stack: List[Deque[int]] = []
+        for x in _re_to_rpn(re_string):
+            if x == "*":
+                stack.append(deque([self.star(self._concat_all(stack.pop()))]))
+            elif x == "+":
+                right = self._concat_all(stack.pop())
+                left = self._concat_all(stack.pop())
+                stack.append(deque([self.union(left, right)]))
+            elif x == ".":
+                right_operands = stack.pop()
+                left_operands = stack.pop()
+                # Movemos siempre la lista mas corta a la mas larga
+                if len(left_operands) >= len(right_operands):
+                    left_operands.extend(right_operands)
+                    stack.append(left_operands)
+                else:
+                    right_operands.extendleft(reversed(left_operands))
+                    stack.append(right_operands)
+            elif x == "λ":
+                stack.append(deque([self._lambda]))
+            else:
+                symbols[x] = None
+                stack.append(deque([self.symbol(x)]))
+
+        # La expresion vacia es el lenguaje vacio
+        self.root = self._concat_all(stack.pop()) if stack else self._empty
+        self.symbols = tuple(symbols)
+        self._symbol_set = frozenset(symbols)
+
+    def _node(
+        self,
+        kind: int,
+        args: Tuple[int, ...],
+        *,
+        nullable: bool,
+    ) -> int:
+        """
+        Devuelve el id de un nodo, creandolo si no existia.
+
+        Returns:
+            Id unico del nodo.
+
+        """
+        key = (kind, args)
+        node_id = self._ids.get(key)
+        if node_id is None:
+            node_id = len(self._nodes)
+            self._nodes.append(key)
+            self._ids[key] = node_id
+            self._nullable.append(nullable)
+        return node_id
+
+    def nullable(self, node: int) -> bool:
+        """
+        Check if an expression accepts the empty string.
+
+        Args:
+            node: Id of the expression.
+
+        Returns:
+            ``True`` if the empty string is accepted. ``False`` otherwise.
+
+        """
+        return self._nullable[node]
+
+    def symbol(self, symbol: str) -> int:
+        """
+        Return the expression that accepts one symbol.
+
+        Args:
+            symbol: Symbol to accept.
+
+        Returns:
+            Id of the expression.
+
+        """
+        return self._node(SYMBOL, (ord(symbol),), nullable=False)
+
+    def concat(self, left: int, right: int) -> int:
+        """
+        Return the concatenation of two expressions.
+
+        Args:
+            left: Id of the first expression.
+            right: Id of the second expression.
+
+        Returns:
+            Id of the normalized concatenation.
+
+        """
+        if left == self._empty or right == self._empty:
+            return self._empty
+
+        # Asociamos siempre a la derecha: (a.b).c = a.(b.c). Como left ya
+        # esta asociada a la derecha basta con recorrer su cadena
+        operands = []
+        while self._nodes[left][0] == CONCAT:
+            first, left = self._nodes[left][1]
+            operands.append(first)
+        operands.append(left)
+
+        node = right
+        for operand in reversed(operands):
+            node = self._concat_pair(operand, node)
+        return node
+
+    def _concat_pair(self, left: int, right: int) -> int:
+        """
+        Concatena dos expresiones no vacias, siendo la primera distinta de
+        una concatenacion.
+
+        Returns:
+            Id de la concatenacion normalizada.
+
+        """
+        if left == self._lambda:
+            return right
+        if right == self._lambda:
+            return left
+
+        return self._node(
+            CONCAT,
+            (left, right),
+            nullable=self._nullable[left] and self._nullable[right],
+        )
+
+    def _concat_all(self, operands: Sequence[int]) -> int:
+        """
+        Concatena una secuencia de expresiones, de derecha a izquierda para
+        que cada paso sea constante.
+
+        Returns:
+            Id de la concatenacion normalizada.
+
+        """
+        node = self._lambda
+        for operand in reversed(operands):
+            node = self.concat(operand, node)
+        return node
+
+    def union(self, left: int, right: int) -> int:
+        """
+        Return the union of two expressions.
+
+        Args:
+            left: Id of the first expression.
+            right: Id of the second expression.
+
+        Returns:
+            Id of the normalized union.
+
+        """
+        return self._union_all((left, right))
+
+    def _union_all(self, operands: Sequence[int]) -> int:
+        """
+        Une una secuencia de expresiones de una vez, sin crear las uniones
+        intermedias.
+
+        Returns:
+            Id de la union normalizada.
+
+        """
+        # Aplanamos, quitamos repetidos y el vacio y ordenamos los operandos
+        members: Set[int] = set()
+        for node in operands:
+            kind, args = self._nodes[node]
+            if kind == UNION:
+                members.update(args)
+            elif node != self._empty:
+                members.add(node)
+
+        if not members:
+            return self._empty
+        if len(members) == 1:
+            return members.pop()
+
+        sorted_members = tuple(sorted(members))
+        return self._node(
+            UNION,
+            sorted_members,
+            nullable=any(self._nullable[m] for m in sorted_members),
+        )
+
+    def star(self, node: int) -> int:
+        """
+        Return the Kleene star of an expression.
+
+        Args:
+            node: Id of the expression.
+
+        Returns:
+            Id of the normalized Kleene star.
+
+        """
+        if node == self._empty or node == self._lambda:
+            return self._lambda
+        if self._nodes[node][0] == STAR:
+            return node
+        return self._node(STAR, (node,), nullable=True)
+
+    def derivative(self, node: int, symbol: str) -> int:
+        """
+        Return the derivative of an expression with respect to a symbol.
+
+        Args:
+            node: Id of the expression.
+            symbol: Symbol consumed.
+
+        Returns:
+            Id of the derivative.
+
+        """
+        key = (node, symbol)
+        derivative = self._derivatives.get(key)
+        if derivative is not None:
+            return derivative
+
+        kind, args = self._nodes[node]
+        if kind == SYMBOL:
+            derivative = self._lambda if args[0] == ord(symbol) else self._empty
+        elif kind == CONCAT:
+            # Recorremos la cadena mientras los operandos acepten la cadena
+            # vacia, sin una llamada recursiva por operando
+            terms = []
+            rest = node
+            while kind == CONCAT:
+                left, rest = args
+                terms.append(self.concat(self.derivative(left, symbol), rest))
+                if not self._nullable[left]:
+                    break
+                kind, args = self._nodes[rest]
+            else:
+                terms.append(self.derivative(rest, symbol))
+            derivative = self._union_all(terms)
+        elif kind == UNION:
+            derivative = self._union_all(
+                [self.derivative(member, symbol) for member in args],
+            )
+        elif kind == STAR:
+            derivative = self.concat(self.derivative(args[0], symbol), node)
+        else:
+            derivative = self._empty
+
+        self._derivatives[key] = derivative
+        return derivative
+
+    def accepts(self, string: str) -> bool:
+        """
+        Return if a string is accepted, computing only the derivatives needed.
+
+        Args:
+            string: String to check.
+
+        Returns:
+            ``True`` if the string is accepted. ``False`` otherwise.
+
+        """
+        node = self.root
+        for symbol in string:
+            if symbol not in self._symbol_set:
+                raise ValueError('Símbolo no recogido en el alfabeto')
+            node = self.derivative(node, symbol)
+        return self._nullable[node]
+
+    def to_automaton(self) -> FiniteAutomaton:
+        """
+        Build the deterministic automaton of the expression.
+
+        Each state is one of the derivatives of the expression reachable from
+        it, and it is final if it accepts the empty string.
+
+        Returns:
+            Complete deterministic automaton equivalent to the expression.
+
+        """
+        nodes = [self.root]
+        node_states = {self.root: 0}
+        transitions = []
+        i = 0
+        while i < len(nodes):
+            for symbol in self.symbols:
+                target = self.derivative(nodes[i], symbol)
+                if target not in node_states:
+                    node_states[target] = len(nodes)
+                    nodes.append(target)
+                transitions.append((i, symbol, node_states[target]))
+            i += 1
+
+        states = [
+            State("q" + str(i), is_final=self._nullable[node])
+            for i, node in enumerate(nodes)
+        ]
+        return FiniteAutomaton(
+            initial_state=states[0],
+            states=set(states),
+            symbols=self.symbols,
+            transitions={
+                Transition(states[q1], symbol, states[q2])
+                for q1, symbol, q2 in transitions
+            },
+            validate=False,
+        )
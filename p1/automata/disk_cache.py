@@ -0,0 +1,139 @@
+"""Persistent cache of minimized automata."""
+import hashlib
+import os
+import tempfile
+from typing import Callable, Optional
+
+from typing_extensions import Final
+
+from automata.automaton import FiniteAutomaton
+from automata.re_parser import REParser
+from automata.utils import (
+    AutomataFormat,
+    BinaryAutomataFormat,
+    FormatParseError,
+)
+
+FORMAT_VERSION: Final = 2
+"""
+Version of the layout of the cache. Changing it, or the version of
+:class:`BinaryAutomataFormat`, invalidates every entry.
+"""
+
+
+class DiskCache():
+    """
+    Cache of minimized automata stored in a directory.
+
+    Each entry is the minimal deterministic automaton of a regular expression
+    or of an automaton description in :class:`AutomataFormat`, stored in a
+    file in :class:`BinaryAutomataFormat` named after a hash of the source,
+    :data:`FORMAT_VERSION` and the version of the binary format.
+    Entries are written atomically, so several processes can share the
+    directory. Entries that cannot be read (e.g. truncated) are rebuilt and
+    overwritten.
+
+    Args:
+        directory: Directory of the cache. It is created if needed.
+
+    """
+
+    directory: str
+
+    def __init__(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+
+    def _path(self, kind: str, source: str) -> str:
+        """
+        Devuelve la ruta del fichero de una entrada.
+
+        Returns:
+            Ruta dentro del directorio de la cache.
+
+        """
+        key = (
+            f"{FORMAT_VERSION}\0{BinaryAutomataFormat.version}\0"
+            f"{kind}\0{source}"
+        )
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.aut")
+
+    def _load(self, path: str) -> Optional[FiniteAutomaton]:
+        """
+        Lee una entrada de la cache.
+
+        Returns:
+            El automata guardado, o None si no existe o esta corrupto (p.ej.
+            truncado), para que se reconstruya y se sobrescriba.
+
+        """
+        try:
+            with open(path, "rb") as f:
+                return BinaryAutomataFormat.read(f.read()).to_automaton()
+        except (FileNotFoundError, FormatParseError, ValueError, IndexError):
+            return None
+
+    def _store(self, path: str, automaton: FiniteAutomaton) -> None:
+        """Escribe una entrada en un temporal y la renombra a su ruta."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(BinaryAutomataFormat.write(automaton))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _get(
+        self,
+        kind: str,
+        source: str,
+        build: Callable[[str], FiniteAutomaton],
+    ) -> FiniteAutomaton:
+        """
+        Devuelve el minimo de una entrada, construyendo el automata con build
+        y minimizandolo y guardandolo si no estaba en la cache.
+
+        Returns:
+            Automata determinista minimo de la entrada.
+
+        """
+        path = self._path(kind, source)
+        minimized = self._load(path)
+        if minimized is None:
+            minimized = build(source).to_deterministic().to_minimized()
+            self._store(path, minimized)
+        return minimized
+
+    def create_minimized(self, re_string: str) -> FiniteAutomaton:
+        """
+        Return the minimal deterministic automaton of a regex.
+
+        Args:
+            re_string: String with the regular expression in Kleene notation.
+
+        Returns:
+            Minimal deterministic automaton equivalent to the regex.
+
+        """
+        return self._get("regex", re_string, REParser().create_automaton)
+
+    def read_minimized(self, description: str) -> FiniteAutomaton:
+        """
+        Return the minimal deterministic automaton of a description.
+
+        Args:
+            description: Automaton description in :class:`AutomataFormat`.
+
+        Returns:
+            Minimal deterministic automaton equivalent to the description.
+
+        """
+        return self._get("automaton", description, AutomataFormat.read)
+
+    def clear(self) -> None:
+        """Remove every entry of the cache."""
+        for name in os.listdir(self.directory):
+            if name.endswith(".aut"):
+                os.unlink(os.path.join(self.directory, name))
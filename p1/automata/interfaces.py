@@ -1,13 +1,23 @@
 """General interfaces for automatas."""
+import codecs
+import functools
+import sys
 from abc import ABC, abstractmethod
 from typing import (
+    IO,
     AbstractSet,
+    Any,
     Collection,
     Generic,
+    Iterable,
+    Iterator,
     Optional,
     Sequence,
     Set,
+    Tuple,
     TypeVar,
+    Union,
+    cast,
 )
 
 
@@ -15,20 +25,43 @@ class AbstractState(ABC):
     """
     Abstract definition of an automaton state.
 
+    States are immutable: their hash is computed once and their name is
+    interned, as they are hashed constantly by the algorithms.
+
     Args:
         name: Name of the state.
         is_final: Whether the state is a final state or not.
 
     """
 
+    __slots__ = ("name", "is_final", "_hash")
+
     name: str
     is_final: bool
+    _hash: int
 
     def __init__(self, name: str, *, is_final: bool = False) -> None:
-        self.name = name
-        self.is_final = is_final
+        name = sys.intern(name)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "is_final", is_final)
+        object.__setattr__(self, "_hash", hash((name, is_final)))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (
+            functools.partial(type(self), is_final=self.is_final),
+            (self.name,),
+        )
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, type(self)):
             return NotImplemented
 
@@ -43,7 +76,7 @@ class AbstractState(ABC):
         )
 
     def __hash__(self) -> int:
-        return hash((self.name, self.is_final))
+        return self._hash
 
 
 _State = TypeVar("_State", bound=AbstractState, covariant=True)
@@ -53,6 +86,8 @@ class AbstractTransition(ABC, Generic[_State]):
     """
     Abstract definition of an automaton transition.
 
+    Transitions are immutable, with their hash computed once.
+
     Args:
         initial_state: Initial state of the transition.
         symbol: Symbol consumed in the transition.
@@ -61,9 +96,12 @@ class AbstractTransition(ABC, Generic[_State]):
 
     """
 
+    __slots__ = ("initial_state", "symbol", "final_state", "_hash")
+
     initial_state: _State
     symbol: Optional[str]
     final_state: _State
+    _hash: int
 
     def __init__(
         self,
@@ -71,16 +109,38 @@ class AbstractTransition(ABC, Generic[_State]):
         symbol: Optional[str],
         final_state: _State,
     ) -> None:
-        self.initial_state = initial_state
-        self.symbol = symbol
-        self.final_state = final_state
+        object.__setattr__(self, "initial_state", initial_state)
+        object.__setattr__(self, "symbol", symbol)
+        object.__setattr__(self, "final_state", final_state)
+        object.__setattr__(
+            self,
+            "_hash",
+            hash((initial_state, symbol, final_state)),
+        )
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (
+            type(self),
+            (self.initial_state, self.symbol, self.final_state),
+        )
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, type(self)):
             return NotImplemented
 
+        # Comparing the cached hashes first discards most of the transitions
         return (
-            self.initial_state == other.initial_state
+            self._hash == other._hash
+            and self.initial_state == other.initial_state
             and self.symbol == other.symbol
             and self.final_state == other.final_state
         )
@@ -92,7 +152,7 @@ class AbstractTransition(ABC, Generic[_State]):
         )
 
     def __hash__(self) -> int:
-        return hash((self.initial_state, self.symbol, self.final_state))
+        return self._hash
 
 
 _Transition = TypeVar(
@@ -121,6 +181,8 @@ class AbstractFiniteAutomaton(
             tuple internally.
         transitions: Collection of transitions of the automaton. It is
             converted to a tuple internally.
+        validate: Whether to check that the automaton is consistent. Only
+            algorithms that already guarantee it should disable it.
 
     """
 
@@ -136,8 +198,30 @@ class AbstractFiniteAutomaton(
         states: Collection[_State],
         symbols: Collection[str],
         transitions: Collection[_Transition],
+        validate: bool = True,
+    ) -> None:
+        if validate:
+            self._validate(initial_state, states, symbols, transitions)
+
+        self.initial_state = initial_state
+        self.states = tuple(states)
+        self.symbols = tuple(symbols)
+        self.transitions = tuple(transitions)
+
+    @staticmethod
+    def _validate(
+        initial_state: AbstractState,
+        states: Collection[AbstractState],
+        symbols: Collection[str],
+        transitions: Collection[AbstractTransition[AbstractState]],
     ) -> None:
-        if initial_state not in states:
+        """Check the arguments of the constructor."""
+        # We check membership against sets, as the collections are often
+        # lists or tuples
+        state_set = set(states)
+        symbol_set = set(symbols)
+
+        if initial_state not in state_set:
             raise ValueError(
                 f"Initial state {initial_state.name} "
                 f"is not in the set of states",
@@ -145,24 +229,24 @@ class AbstractFiniteAutomaton(
 
         for t in transitions:
             for s in (t.initial_state, t.final_state):
-                if s not in states:
+                if s not in state_set:
                     raise ValueError(
                         f"State {s} from transition {t}"
                         f"is not in the set of states",
                     )
 
-            if t.symbol is not None and t.symbol not in symbols:
+            if t.symbol is not None and t.symbol not in symbol_set:
                 raise ValueError(
                     f"Symbol {t.symbol} from transition {t}"
                     f"is not in the set of symbols",
                 )
 
-        if len(set(states)) != len(states):
+        if len(state_set) != len(states):
             raise ValueError(
                 "There are repeated states",
             )
 
-        if len(set(symbols)) != len(symbols):
+        if len(symbol_set) != len(symbols):
             raise ValueError(
                 "There are repeated symbols",
             )
@@ -172,11 +256,6 @@ class AbstractFiniteAutomaton(
                 "There are repeated transitions",
             )
 
-        self.initial_state = initial_state
-        self.states = tuple(states)
-        self.symbols = tuple(symbols)
-        self.transitions = tuple(transitions)
-
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             return NotImplemented
@@ -234,6 +313,52 @@ _Automaton = TypeVar(
 )
 
 
+StreamSource = Union[
+    str,
+    bytes,
+    bytearray,
+    memoryview,
+    IO[str],
+    IO[bytes],
+    Iterable[Union[str, bytes, bytearray, memoryview]],
+]
+"""Inputs accepted by the streaming methods of the evaluators."""
+
+
+def _text_chunks(
+    source: StreamSource,
+    encoding: str,
+    chunk_size: int,
+) -> Iterator[str]:
+    """Split an input in decoded text chunks."""
+    if isinstance(source, str):
+        yield source
+        return
+
+    chunks: Iterable[Union[str, bytes, bytearray, memoryview]]
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source).cast("B")
+        chunks = (
+            view[i:i + chunk_size] for i in range(0, len(view), chunk_size)
+        )
+    elif hasattr(source, "read"):
+        read = cast(IO[Any], source).read
+        chunks = iter(lambda: read(chunk_size) or None, None)
+    else:
+        chunks = source
+
+    # The decoder keeps the bytes of a character split between chunks
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for chunk in chunks:
+        text = chunk if isinstance(chunk, str) else decoder.decode(chunk)
+        if text:
+            yield text
+
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+
 class AbstractFiniteAutomatonEvaluator(
     ABC,
     Generic[_Automaton, _State],
@@ -285,18 +410,101 @@ class AbstractFiniteAutomatonEvaluator(
         """
         Process a full string of symbols.
 
+        Processing stops when the evaluator reaches a dead state (see
+        :meth:`is_dead`), although the rest of the string is still checked
+        against the alphabet.
+
         Args:
             string: String to process.
 
         """
-        for symbol in string:
+        symbols = iter(string)
+        for symbol in symbols:
             self.process_symbol(symbol)
+            if self.is_dead():
+                # The string is rejected whatever comes next, so we only
+                # check that the rest of the symbols are in the alphabet
+                if not set(self.automaton.symbols).issuperset(symbols):
+                    raise ValueError('Símbolo no recogido en el alfabeto')
+                return
+
+    def process_stream(
+        self,
+        source: StreamSource,
+        *,
+        encoding: str = "utf-8",
+        chunk_size: int = 65536,
+    ) -> None:
+        """
+        Process a string read by chunks, with bounded memory.
+
+        Processing stops as soon as the evaluator reaches a dead state (see
+        :meth:`is_dead`), as no continuation of the input can be accepted.
+        The rest of the input is not read, nor checked against the alphabet.
+
+        Args:
+            source: Input to process. It can be a string, a bytes-like
+                object (such as a ``memoryview`` of a ``mmap``), a text or
+                binary file, or an iterable of string or bytes chunks. Bytes
+                are decoded incrementally, so a character may be split
+                between chunks.
+            encoding: Encoding of the bytes read.
+            chunk_size: Size of the chunks read from files and bytes-like
+                objects.
+
+        """
+        if self.is_dead():
+            return
+
+        for chunk in _text_chunks(source, encoding, chunk_size):
+            for symbol in chunk:
+                self.process_symbol(symbol)
+                if self.is_dead():
+                    return
+
+    def accepts_stream(
+        self,
+        source: StreamSource,
+        *,
+        encoding: str = "utf-8",
+        chunk_size: int = 65536,
+    ) -> bool:
+        """
+        Return if a string read by chunks is accepted without changing state.
+
+        See :meth:`process_stream` for the arguments.
+
+        Note: This function is NOT thread-safe.
+
+        """
+        old_states = self.current_states
+        try:
+            self.process_stream(
+                source,
+                encoding=encoding,
+                chunk_size=chunk_size,
+            )
+            accepted = self.is_accepting()
+        finally:
+            self.current_states = old_states
+
+        return accepted
 
     @abstractmethod
     def is_accepting(self) -> bool:
         """Check if the current state is an accepting one."""
         raise NotImplementedError("This method must be implemented.")
 
+    def is_dead(self) -> bool:
+        """
+        Check if no continuation of the input can be accepted.
+
+        The default implementation only detects an empty set of current
+        states.
+
+        """
+        return not self.current_states
+
     def accepts(self, string: str) -> bool:
         """
         Return if a string is accepted without changing state.
@@ -0,0 +1,149 @@
+"""Matching of a string against many patterns at once."""
+from typing import Dict, FrozenSet, List, Sequence, Set, Tuple, Union
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.re_parser import REParser
+
+
+class MultiPatternMatcher():
+    """
+    Matcher of a string against many automata in a single pass.
+
+    The automata are joined in one automaton, keeping their states apart,
+    and determinized starting from all their initial states at once. Each
+    deterministic state remembers which patterns have a final state in it,
+    so one walk over the string finds every pattern that accepts it.
+
+    Args:
+        patterns: Automata or regular expressions in Kleene notation. Each
+            pattern is identified by its position in the sequence.
+
+    Attributes:
+        patterns: Automaton of each pattern.
+        symbols: Symbols of all the patterns.
+
+    """
+
+    patterns: Tuple[FiniteAutomaton, ...]
+    symbols: Tuple[str, ...]
+
+    def __init__(
+        self,
+        patterns: Sequence[Union[FiniteAutomaton, str]],
+    ) -> None:
+        parser = REParser()
+        self.patterns = tuple(
+            parser.create_automaton(p) if isinstance(p, str) else p
+            for p in patterns
+        )
+
+        union, tags = self._union(self.patterns)
+        self.symbols = tuple(union.symbols)
+
+        subsets, self._rows = union._subset_construction(
+            union.states[:len(self.patterns)],
+        )
+
+        # Patrones aceptados en cada subconjunto, y si alguno puede llegar
+        # todavia a un estado final
+        live = union.live_states()
+        self._matches: List[FrozenSet[int]] = []
+        self._dead: List[bool] = []
+        for subset in subsets:
+            self._matches.append(frozenset(
+                tags[q] for q in subset if union.states[q].is_final
+            ))
+            self._dead.append(not any(union.states[q] in live for q in subset))
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"patterns={len(self.patterns)!r}, "
+            f"states={len(self._rows)!r})"
+        )
+
+    @staticmethod
+    def _union(
+        patterns: Sequence[FiniteAutomaton],
+    ) -> Tuple[FiniteAutomaton, List[int]]:
+        """
+        Junta los automatas en uno solo sin transiciones entre ellos,
+        renombrando sus estados como p<patron>_<nombre>. A diferencia de
+        REParser._create_automaton_union no hay un estado final comun: los
+        estados finales siguen siendo los de cada patron. Los estados
+        iniciales de los patrones son los primeros, en orden.
+
+        Returns:
+            Tupla con el automata y el patron de cada uno de sus estados.
+
+        """
+        initial_states: List[State] = []
+        other_states: List[State] = []
+        initial_tags: List[int] = []
+        other_tags: List[int] = []
+        symbols: Dict[str, None] = {}
+        transitions: Set[Transition] = set()
+        for k, automaton in enumerate(patterns):
+            renamed = {
+                st: State(f"p{k}_{st.name}", is_final=st.is_final)
+                for st in automaton.states
+            }
+            for st in automaton.states:
+                if st == automaton.initial_state:
+                    initial_states.append(renamed[st])
+                    initial_tags.append(k)
+                else:
+                    other_states.append(renamed[st])
+                    other_tags.append(k)
+
+            symbols.update(dict.fromkeys(automaton.symbols))
+            transitions.update(
+                Transition(
+                    renamed[tr.initial_state],
+                    tr.symbol,
+                    renamed[tr.final_state],
+                )
+                for tr in automaton.transitions
+            )
+
+        if not initial_states:
+            # Sin patrones, un unico estado que no acepta nada
+            initial_states.append(State("empty", is_final=False))
+            initial_tags.append(-1)
+
+        union = FiniteAutomaton(
+            initial_state=initial_states[0],
+            states=initial_states + other_states,
+            symbols=tuple(symbols),
+            transitions=transitions,
+            validate=False,
+        )
+        return union, initial_tags + other_tags
+
+    def matches(self, string: str) -> FrozenSet[int]:
+        """
+        Return the patterns that accept a string.
+
+        Args:
+            string: String to check.
+
+        Returns:
+            Positions of the patterns that accept the string.
+
+        """
+        rows = self._rows
+        dead = self._dead
+        state = 0
+        symbols = iter(string)
+        try:
+            for symbol in symbols:
+                state = rows[state][symbol]
+                if dead[state]:
+                    # Solo falta comprobar que el resto esta en el alfabeto
+                    if not set(self.symbols).issuperset(symbols):
+                        raise ValueError('Símbolo no recogido en el alfabeto')
+                    return frozenset()
+        except KeyError as e:
+            raise ValueError('Símbolo no recogido en el alfabeto') from e
+
+        return self._matches[state]
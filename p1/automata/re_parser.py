@@ -1,12 +1,223 @@
 """Conversion from regex to automata."""
 from automata.automaton import FiniteAutomaton, State, Transition
-from automata.re_parser_interfaces import AbstractREParser
-from typing import Collection
+from automata.derivatives import RegexDerivatives
+from automata.re_parser_interfaces import AbstractREParser, _re_to_rpn
+from typing import Collection, Dict, List, Optional, Set, Tuple
 
 
 class REParser(AbstractREParser):
     """Class for processing regular expressions in Kleene's syntax."""
 
+    def create_automaton(
+        self,
+        re_string: str,
+        algorithm: str = "thompson",
+    ) -> FiniteAutomaton:
+        """
+        Create an automaton from a regex.
+
+        Args:
+            re_string: String with the regular expression in Kleene notation.
+            algorithm: Construction algorithm. ``"thompson"`` composes the
+                automata of the subexpressions, copying only the states that
+                stop being final at each step. ``"linear"`` builds the same
+                automaton in linear time, numbering each state once and
+                joining the fragments by their entry and exit states.
+                ``"glushkov"`` builds the position automaton: no lambda
+                transitions and one state per symbol occurrence plus the
+                initial state. ``"derivatives"`` builds directly a
+                deterministic automaton whose states are the derivatives of
+                the expression.
+
+        Returns:
+            Automaton equivalent to the regex.
+
+        """
+        if algorithm == "thompson":
+            return super().create_automaton(re_string)
+        if algorithm == "linear":
+            return self._create_automaton_linear(re_string)
+        if algorithm == "glushkov":
+            return self._create_automaton_glushkov(re_string)
+        if algorithm == "derivatives":
+            return RegexDerivatives(re_string).to_automaton()
+        raise ValueError(f"Unknown construction algorithm {algorithm}")
+
+    def _new_state_id(self) -> int:
+        """
+        Reserva un identificador de estado nuevo con el contador compartido.
+
+        Returns:
+            Identificador del nuevo estado.
+
+        """
+        self.state_counter += 1
+        return self.state_counter - 1
+
+    def _new_state(
+            self,
+            taken: Collection[str] = (),
+            *,
+            is_final: bool = False,
+    ) -> State:
+        """
+        Crea un estado con el siguiente nombre del contador compartido que no
+        este en taken.
+
+        Returns:
+            Estado nuevo.
+
+        """
+        name = "q" + str(self._new_state_id())
+        while name in taken:
+            name = "q" + str(self._new_state_id())
+        return State(name, is_final=is_final)
+
+    def _create_automaton_linear(
+            self,
+            re_string: str,
+    ) -> FiniteAutomaton:
+        """
+        Crea el automata de Thompson de una expresion regular sin renombrar
+        estados. Cada subexpresion es un fragmento (estado de entrada, estado
+        de salida) con estados numerados una sola vez, y las operaciones solo
+        anaden transiciones lambda entre entradas y salidas. Los estados y
+        transiciones se crean al final, en una sola pasada.
+
+        Returns:
+            Automata equivalente a la expresion regular.
+
+        """
+        if not re_string:
+            return self._create_automaton_empty()
+
+        self.state_counter = 0
+        transitions: List[Tuple[int, Optional[str], int]] = []
+        symbols: Dict[str, None] = {}
+        stack: List[Tuple[int, int]] = []
+        for x in _re_to_rpn(re_string):
+            if x == "*":
+                entry, out = stack.pop()
+                initial, final = self._new_state_id(), self._new_state_id()
+                transitions.append((initial, None, entry))
+                transitions.append((initial, None, final))
+                transitions.append((out, None, entry))
+                transitions.append((out, None, final))
+                stack.append((initial, final))
+            elif x == "+":
+                entry2, out2 = stack.pop()
+                entry1, out1 = stack.pop()
+                initial, final = self._new_state_id(), self._new_state_id()
+                transitions.append((initial, None, entry1))
+                transitions.append((initial, None, entry2))
+                transitions.append((out1, None, final))
+                transitions.append((out2, None, final))
+                stack.append((initial, final))
+            elif x == ".":
+                entry2, out2 = stack.pop()
+                entry1, out1 = stack.pop()
+                transitions.append((out1, None, entry2))
+                stack.append((entry1, out2))
+            elif x == "λ":
+                state = self._new_state_id()
+                stack.append((state, state))
+            else:
+                initial, final = self._new_state_id(), self._new_state_id()
+                transitions.append((initial, x, final))
+                symbols[x] = None
+                stack.append((initial, final))
+
+        entry, out = stack.pop()
+        states = [
+            State("q" + str(i), is_final=i == out)
+            for i in range(self.state_counter)
+        ]
+        return FiniteAutomaton(
+            initial_state=states[entry],
+            states=set(states),
+            symbols=set(symbols),
+            transitions={
+                Transition(states[q1], symbol, states[q2])
+                for q1, symbol, q2 in transitions
+            },
+            validate=False,
+        )
+
+    def _create_automaton_glushkov(
+            self,
+            re_string: str,
+    ) -> FiniteAutomaton:
+        """
+        Crea el automata de posiciones (Glushkov) de una expresion regular.
+
+        Cada aparicion de un simbolo es una posicion. Para cada subexpresion
+        calculamos si acepta la cadena vacia y sus posiciones primeras y
+        ultimas, y vamos anotando que posiciones pueden seguir a cada una. El
+        automata tiene un estado inicial q0 y un estado por posicion, al que
+        se llega leyendo su simbolo.
+
+        Returns:
+            Automata sin transiciones lambda equivalente a la expresion.
+
+        """
+        # Simbolo de cada posicion (la posicion 0 es el estado inicial)
+        position_symbols: List[Optional[str]] = [None]
+        follow: List[Set[int]] = [set()]
+        # Pila de (anulable, primeras, ultimas) de cada subexpresion
+        stack: List[Tuple[bool, Set[int], Set[int]]] = []
+        for x in _re_to_rpn(re_string):
+            if x == "*":
+                _, first, last = stack.pop()
+                for p in last:
+                    follow[p] |= first
+                stack.append((True, first, last))
+            elif x == "+":
+                nullable2, first2, last2 = stack.pop()
+                nullable1, first1, last1 = stack.pop()
+                stack.append(
+                    (nullable1 or nullable2, first1 | first2, last1 | last2),
+                )
+            elif x == ".":
+                nullable2, first2, last2 = stack.pop()
+                nullable1, first1, last1 = stack.pop()
+                for p in last1:
+                    follow[p] |= first2
+                stack.append((
+                    nullable1 and nullable2,
+                    first1 | first2 if nullable1 else first1,
+                    last1 | last2 if nullable2 else last2,
+                ))
+            elif x == "λ":
+                stack.append((True, set(), set()))
+            else:
+                position = len(position_symbols)
+                position_symbols.append(x)
+                follow.append(set())
+                stack.append((False, {position}, {position}))
+
+        # La expresion vacia es el lenguaje vacio
+        nullable, first, last = stack.pop() if stack else (False, set(), set())
+        follow[0] = first
+
+        states = [
+            State("q" + str(p), is_final=p in last or (p == 0 and nullable))
+            for p in range(len(position_symbols))
+        ]
+        transitions = set()
+        for p, followers in enumerate(follow):
+            for q in followers:
+                symbol = position_symbols[q]
+                assert symbol is not None
+                transitions.add(Transition(states[p], symbol, states[q]))
+
+        return FiniteAutomaton(
+            initial_state=states[0],
+            states=set(states),
+            symbols={s for s in position_symbols if s is not None},
+            transitions=transitions,
+            validate=False,
+        )
+
     def _create_automaton_empty(
             self,
     ) -> FiniteAutomaton:
@@ -17,8 +228,8 @@ class REParser(AbstractREParser):
             Automaton that accepts the empty language.
 
         """
-        initial_state = State("q0", is_final=False)
-        final_state = State("qf", is_final=True)
+        initial_state = self._new_state()
+        final_state = self._new_state(is_final=True)
         states = set({initial_state, final_state})
         symbols: Collection[str] = []
         transitions: Collection[Transition] = []
@@ -34,12 +245,13 @@ class REParser(AbstractREParser):
             Automaton that accepts the empty string.
 
         """
-        initial_state = State("q0", is_final=True)
+        initial_state = self._new_state(is_final=True)
         states = set({initial_state})
         symbols: Collection[str] = []
         transitions: Collection[Transition] = []
         return FiniteAutomaton(initial_state=initial_state, states=states,
-                                symbols=symbols, transitions=transitions)
+                                symbols=symbols, transitions=transitions,
+                                validate=False)
 
     def _create_automaton_symbol(
             self,
@@ -55,13 +267,93 @@ class REParser(AbstractREParser):
             Automaton that accepts a symbol.
 
         """
-        initial_state = State("q0", is_final=False)
-        final_state = State("qf", is_final=True)
+        initial_state = self._new_state()
+        final_state = self._new_state(is_final=True)
         states = set({initial_state, final_state})
         symbols = set({symbol})
         transitions = set({Transition(initial_state, symbol, final_state)})
         return FiniteAutomaton(initial_state=initial_state, states=states,
-                                symbols=symbols, transitions=transitions)
+                                symbols=symbols, transitions=transitions,
+                                validate=False)
+
+    def _renamed(
+            self,
+            automaton: FiniteAutomaton,
+            taken: Collection[str],
+            *,
+            clear_final: bool,
+    ) -> Tuple[Dict[State, State], Set[Transition]]:
+        """
+        Copia los estados del automata con nombres nuevos del contador
+        compartido que no esten en taken, y sus transiciones entre las
+        copias.
+
+        Returns:
+            Copia de cada estado y las transiciones copiadas.
+
+        """
+        renamed = {
+            state: self._new_state(
+                taken,
+                is_final=state.is_final and not clear_final,
+            )
+            for state in automaton.states
+        }
+
+        transitions = {
+            Transition(
+                renamed[t.initial_state], t.symbol, renamed[t.final_state],
+            )
+            for t in automaton.transitions
+        }
+        return renamed, transitions
+
+    def _operand(
+            self,
+            automaton: FiniteAutomaton,
+            taken: Set[str],
+            *,
+            clear_final: bool,
+    ) -> Tuple[Dict[State, State], Set[Transition]]:
+        """
+        Prepara un automata para formar parte de otro. Los estados son
+        inmutables, asi que se copian los finales que dejan de serlo. Los
+        automatas de create_automaton ya tienen nombres distintos del
+        contador compartido, y solo se renombran todos los estados si alguno
+        coincide con uno de taken (p.ej. operandos de llamadas distintas).
+        Anade a taken los nombres usados.
+
+        Returns:
+            Copia de cada estado que cambia y las transiciones resultantes.
+
+        """
+        names = {state.name for state in automaton.states}
+        if not taken.isdisjoint(names):
+            renamed, transitions = self._renamed(
+                automaton, taken, clear_final=clear_final,
+            )
+            taken.update(state.name for state in renamed.values())
+            return renamed, transitions
+
+        taken.update(names)
+        renamed = {
+            state: State(state.name, is_final=False)
+            for state in automaton.states
+            if clear_final and state.is_final
+        }
+        if not renamed:
+            return renamed, set(automaton.transitions)
+
+        transitions = set()
+        for t in automaton.transitions:
+            if t.initial_state in renamed or t.final_state in renamed:
+                t = Transition(
+                    renamed.get(t.initial_state, t.initial_state),
+                    t.symbol,
+                    renamed.get(t.final_state, t.final_state),
+                )
+            transitions.add(t)
+        return renamed, transitions
 
     def _create_automaton_star(
             self,
@@ -77,30 +369,26 @@ class REParser(AbstractREParser):
             Automaton that accepts the Kleene star.
 
         """
-        initial_state = State("q0", is_final=False)
-        final_state = State("qf", is_final=True)
-
-        a_states = set()
-        # Renombramos los viejos estados para no repetir q0 y qf
-        self.state_counter = 0
-        for state in automaton.states:
-            self.state_counter += 1
-            state.name = "q" + str(self.state_counter)
-            a_states.add(state)
-
         # Guardamos los estados finales (que dejan de serlo)
-        a_final_states = list()
-        for state in automaton.states:
-            if state.is_final:
-                a_final_states.append(state)
-                state.is_final = False
+        taken: Set[str] = set()
+        a_states, transitions = self._operand(
+            automaton, taken, clear_final=True,
+        )
+        a_initial_state = a_states.get(
+            automaton.initial_state, automaton.initial_state,
+        )
+        a_final_states = [
+            a_states[state] for state in automaton.states if state.is_final
+        ]
+
+        initial_state = self._new_state(taken)
+        final_state = self._new_state(taken, is_final=True)
 
-        transitions = set(automaton.transitions)
         # Lambda transition:
-        transitions.add(Transition(initial_state, None, automaton.initial_state))
+        transitions.add(Transition(initial_state, None, a_initial_state))
         transitions.add(Transition(initial_state, None, final_state))
         for state in a_final_states:
-            transitions.add(Transition(state, None, automaton.initial_state))
+            transitions.add(Transition(state, None, a_initial_state))
             transitions.add(Transition(state, None, final_state))
 
         # Creamos el set de estados
@@ -112,7 +400,8 @@ class REParser(AbstractREParser):
                     states.add(s)
 
         return FiniteAutomaton(initial_state=initial_state, states=states,
-                            symbols=automaton.symbols, transitions=transitions)
+                            symbols=automaton.symbols, transitions=transitions,
+                            validate=False)
 
     def _create_automaton_union(
             self,
@@ -130,38 +419,39 @@ class REParser(AbstractREParser):
             Automaton that accepts the union.
 
         """
-        initial_state = State("q0", is_final=False)
-        final_state = State("qf", is_final=True)
-
-        # Renombramos los viejos estados para no repetir
-        a1_states = set()
-        self.state_counter = 0
-        for state in automaton1.states:
-            self.state_counter += 1
-            state.name = "q" + str(self.state_counter)
-            a1_states.add(state)
-        a2_states = set()
-        for state in automaton2.states:
-            self.state_counter += 1
-            state.name = "q" + str(self.state_counter)
-            a2_states.add(state)
+        # Guardamos los estados finales (que dejan de serlo)
+        taken: Set[str] = set()
+        a1_states, transitions = self._operand(
+            automaton1, taken, clear_final=True,
+        )
+        a2_states, a2_transitions = self._operand(
+            automaton2, taken, clear_final=True,
+        )
+        pre_final_states = [
+            a1_states[state] for state in automaton1.states if state.is_final
+        ] + [
+            a2_states[state] for state in automaton2.states if state.is_final
+        ]
+
+        initial_state = self._new_state(taken)
+        final_state = self._new_state(taken, is_final=True)
 
         # Juntamos los simbolos en un mismo set
         symbols = set(automaton1.symbols)
         symbols.update(automaton2.symbols)
 
-        # Guardamos los estados finales (que dejan de serlo)
-        pre_final_states = list()
-        for state in set(a1_states).union(set(a2_states)):
-            if state.is_final:
-                pre_final_states.append(state)
-                state.is_final = False
-
-        transitions = set(automaton1.transitions)
-        transitions.update(automaton2.transitions)
+        transitions.update(a2_transitions)
         # Lambda transition:
-        transitions.add(Transition(initial_state, None, automaton1.initial_state))
-        transitions.add(Transition(initial_state, None, automaton2.initial_state))
+        transitions.add(Transition(
+            initial_state,
+            None,
+            a1_states.get(automaton1.initial_state, automaton1.initial_state),
+        ))
+        transitions.add(Transition(
+            initial_state,
+            None,
+            a2_states.get(automaton2.initial_state, automaton2.initial_state),
+        ))
         for state in pre_final_states:
             transitions.add(Transition(state, None, final_state))
 
@@ -174,7 +464,8 @@ class REParser(AbstractREParser):
                     states.add(s)
 
         return FiniteAutomaton(initial_state=initial_state, states=states,
-                                symbols=symbols, transitions=transitions)
+                                symbols=symbols, transitions=transitions,
+                                validate=False)
 
     def _create_automaton_concat(
             self,
@@ -192,37 +483,32 @@ class REParser(AbstractREParser):
             Automaton that accepts the concatenation.
 
         """
-        initial_state = automaton1.initial_state
-
-        # Renombramos los viejos estados para no repetir
-        a1_states = set()
-        self.state_counter = 0
-        for state in automaton1.states:
-            self.state_counter += 1
-            state.name = "q" + str(self.state_counter)
-            a1_states.add(state)
-        a2_states = set()
-        for state in automaton2.states:
-            self.state_counter += 1
-            state.name = "q" + str(self.state_counter)
-            a2_states.add(state)
+        # Guardamos los estados finales del primero (que dejan de serlo)
+        taken: Set[str] = set()
+        a1_states, transitions = self._operand(
+            automaton1, taken, clear_final=True,
+        )
+        a2_states, a2_transitions = self._operand(
+            automaton2, taken, clear_final=False,
+        )
+        initial_state = a1_states.get(
+            automaton1.initial_state, automaton1.initial_state,
+        )
+        a2_initial_state = a2_states.get(
+            automaton2.initial_state, automaton2.initial_state,
+        )
+        a1_final_states = [
+            a1_states[state] for state in automaton1.states if state.is_final
+        ]
 
         # Juntamos los simbolos en un mismo set
         symbols = set(automaton1.symbols)
         symbols.update(automaton2.symbols)
 
-        # Guardamos los estados finales (que dejan de serlo)
-        a1_final_states = list()
-        for state in a1_states:
-            if state.is_final:
-                a1_final_states.append(state)
-                state.is_final = False
-
-        transitions = set(automaton1.transitions)
-        transitions.update(automaton2.transitions)
+        transitions.update(a2_transitions)
         # Lambda transition:
         for state in a1_final_states:
-            transitions.add(Transition(state, None, automaton2.initial_state))
+            transitions.add(Transition(state, None, a2_initial_state))
 
         # Creamos el set de estados
         states = set()
@@ -233,4 +519,5 @@ class REParser(AbstractREParser):
                     states.add(s)
 
         return FiniteAutomaton(initial_state=initial_state, states=states,
-                                symbols=symbols, transitions=transitions)
+                                symbols=symbols, transitions=transitions,
+                                validate=False)
@@ -0,0 +1,234 @@
+"""Search of the substrings of a text accepted by an automaton."""
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from automata.automaton import FiniteAutomaton, State, Transition
+
+Span = Tuple[int, int]
+"""Start and end (exclusive) of a match, as in ``text[start:end]``."""
+
+
+class FiniteAutomatonSearcher():
+    """
+    Searcher of the substrings of a text accepted by an automaton.
+
+    Matches are leftmost-longest and do not overlap: the first match is the
+    longest one among those that start first, and each search continues
+    where the previous match ended (or one character after, for empty
+    matches).
+
+    The text is read twice. A backwards pass with the deterministic
+    automaton of ``Σ*·reverse(L)`` marks the positions where some match
+    starts, so the forward pass with the deterministic automaton of ``L``
+    only runs from those positions. The forward runs remember the furthest
+    accepting position found from each pair of position and state, so no
+    pair is explored twice and the search takes ``O(len(text) * states)``
+    time in the worst case.
+
+    Characters that are not symbols of the automaton can appear in the
+    text, but are never part of a match.
+
+    Args:
+        automaton: Automaton whose language is searched.
+
+    """
+
+    def __init__(self, automaton: FiniteAutomaton) -> None:
+        self.automaton = automaton
+
+        forward = automaton.to_deterministic().to_minimized()
+        self._columns: Dict[str, int] = {
+            s: i for i, s in enumerate(automaton.symbols)
+        }
+        (
+            self._forward_initial,
+            self._forward_rows,
+            self._forward_accept,
+        ) = self._tables(forward)
+        live = forward.live_states()
+        self._forward_live = [st in live for st in forward.states]
+
+        (
+            self._backward_initial,
+            self._backward_rows,
+            self._backward_accept,
+        ) = self._tables(self._any_prefix(automaton.reverse()))
+
+    def _tables(
+        self,
+        automaton: FiniteAutomaton,
+    ) -> Tuple[int, List[List[int]], List[bool]]:
+        """
+        Convierte un automata determinista en tablas, con una columna por
+        simbolo en el orden de self._columns.
+
+        Returns:
+            Indice del estado inicial, la fila de destinos (-1 si no hay
+            transicion) de cada estado y si cada estado es final.
+
+        """
+        state_ids = {st: i for i, st in enumerate(automaton.states)}
+        rows = [[-1] * len(self._columns) for _ in automaton.states]
+        for tr in automaton.transitions:
+            assert tr.symbol is not None
+            rows[state_ids[tr.initial_state]][self._columns[tr.symbol]] = (
+                state_ids[tr.final_state]
+            )
+
+        return (
+            state_ids[automaton.initial_state],
+            rows,
+            [st.is_final for st in automaton.states],
+        )
+
+    @staticmethod
+    def _any_prefix(automaton: FiniteAutomaton) -> FiniteAutomaton:
+        """
+        Devuelve el automata determinista de Σ* seguido del lenguaje del
+        automata, con un nuevo estado inicial que consume cualquier simbolo.
+
+        Returns:
+            Automata determinista completo.
+
+        """
+        names = {st.name for st in automaton.states}
+        name = "qs"
+        while name in names:
+            name += "_"
+
+        initial_state = State(name, is_final=False)
+        transitions = set(automaton.transitions)
+        transitions.add(
+            Transition(initial_state, None, automaton.initial_state),
+        )
+        for symbol in automaton.symbols:
+            transitions.add(Transition(initial_state, symbol, initial_state))
+
+        return FiniteAutomaton(
+            initial_state=initial_state,
+            states=[*automaton.states, initial_state],
+            symbols=automaton.symbols,
+            transitions=transitions,
+            validate=False,
+        ).to_deterministic()
+
+    def _starts(self, text: str) -> bytearray:
+        """
+        Recorre el texto hacia atras marcando las posiciones (de 0 a
+        len(text), ambas incluidas) en las que empieza alguna coincidencia.
+
+        Returns:
+            Array con un 1 en cada posicion de comienzo.
+
+        """
+        columns = self._columns
+        rows = self._backward_rows
+        accept = self._backward_accept
+        initial = self._backward_initial
+
+        starts = bytearray(len(text) + 1)
+        state = initial
+        starts[len(text)] = accept[state]
+        for i in range(len(text) - 1, -1, -1):
+            column = columns.get(text[i])
+            # Un caracter fuera del alfabeto solo lo consume el prefijo Σ*,
+            # que vuelve al estado inicial
+            state = initial if column is None else rows[state][column]
+            starts[i] = accept[state]
+        return starts
+
+    def finditer(self, text: str, pos: int = 0) -> Iterator[Span]:
+        """
+        Return an iterator over the matches in a text.
+
+        Args:
+            text: Text to search.
+            pos: Position of the text where the search starts.
+
+        Returns:
+            Iterator over the spans of the leftmost-longest non-overlapping
+            matches, in order.
+
+        """
+        starts = self._starts(text)
+        columns = self._columns
+        rows = self._forward_rows
+        accept = self._forward_accept
+        live = self._forward_live
+        initial = self._forward_initial
+        length = len(text)
+
+        # {(posicion, estado): final mas lejano aceptado desde ahi, o -1}
+        furthest: Dict[Tuple[int, int], int] = {}
+        furthest_end = -1
+
+        while True:
+            pos = starts.find(1, pos)
+            if pos < 0:
+                return
+
+            if pos > furthest_end:
+                # Ninguna ejecucion anterior llego hasta aqui
+                furthest.clear()
+
+            # Avanzamos hasta un par ya visitado, el final del texto o un
+            # estado muerto, guardando el camino
+            path = []
+            i = pos
+            state = initial
+            while True:
+                end = furthest.get((i, state))
+                if end is not None:
+                    break
+
+                path.append((i, state))
+                if i == length:
+                    end = i if accept[state] else -1
+                    break
+
+                column = columns.get(text[i])
+                state = -1 if column is None else rows[state][column]
+                i += 1
+                if state < 0 or not live[state]:
+                    end = -1
+                    break
+
+            # Deshacemos el camino calculando el final mas lejano de cada par
+            for i, state in reversed(path):
+                if end < 0 and accept[state]:
+                    end = i
+                furthest[i, state] = end
+            if path:
+                furthest_end = max(furthest_end, path[-1][0])
+
+            assert end >= pos
+            yield pos, end
+            pos = end if end > pos else pos + 1
+
+    def findall(self, text: str, pos: int = 0) -> List[Span]:
+        """
+        Return the matches in a text.
+
+        Args:
+            text: Text to search.
+            pos: Position of the text where the search starts.
+
+        Returns:
+            Spans of the leftmost-longest non-overlapping matches, in order.
+
+        """
+        return list(self.finditer(text, pos))
+
+    def search(self, text: str, pos: int = 0) -> Optional[Span]:
+        """
+        Return the first match in a text.
+
+        Args:
+            text: Text to search.
+            pos: Position of the text where the search starts.
+
+        Returns:
+            Span of the leftmost-longest match, or ``None`` if there is no
+            match.
+
+        """
+        return next(self.finditer(text, pos), None)
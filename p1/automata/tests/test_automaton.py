@@ -0,0 +1,198 @@
+"""Test the construction of automatas."""
+import pickle
+import unittest
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.utils import AutomataFormat
+
+
+class TestStateTransition(unittest.TestCase):
+    """Tests for states and transitions."""
+
+    def test_immutable(self) -> None:
+        """Test that states and transitions cannot be modified."""
+        state = State("q0")
+        transition = Transition(state, "a", state)
+
+        with self.assertRaises(AttributeError):
+            state.name = "q1"
+        with self.assertRaises(AttributeError):
+            transition.symbol = "b"
+        with self.assertRaises(AttributeError):
+            state.label = "q1"
+
+    def test_equality(self) -> None:
+        """Test equality and hashing."""
+        state = State("q" + str(0), is_final=True)
+        transition = Transition(state, "a", state)
+
+        self.assertIs(state.name, State("q0").name)
+        self.assertEqual(state, State("q0", is_final=True))
+        self.assertNotEqual(state, State("q0"))
+        self.assertEqual(hash(state), hash(State("q0", is_final=True)))
+        self.assertEqual(
+            {transition},
+            {Transition(State("q0", is_final=True), "a", state)},
+        )
+        self.assertNotEqual(transition, Transition(state, None, state))
+
+    def test_pickle(self) -> None:
+        """Test that states and transitions can be serialized."""
+        transition = Transition(State("q0"), None, State("q1", is_final=True))
+
+        self.assertEqual(pickle.loads(pickle.dumps(transition)), transition)
+
+
+class TestConstructor(unittest.TestCase):
+    """Tests for the validation of the constructor."""
+
+    def setUp(self) -> None:
+        self.q0 = State("q0")
+        self.q1 = State("q1", is_final=True)
+        self.transitions = [
+            Transition(self.q0, "a", self.q1),
+            Transition(self.q1, None, self.q0),
+        ]
+
+    def test_valid(self) -> None:
+        """Test that consistent arguments are accepted."""
+        automaton = FiniteAutomaton(
+            initial_state=self.q0,
+            states=[self.q0, self.q1],
+            symbols="ab",
+            transitions=self.transitions,
+        )
+        self.assertEqual(automaton.states, (self.q0, self.q1))
+        self.assertEqual(automaton.symbols, ("a", "b"))
+
+    def test_invalid(self) -> None:
+        """Test that inconsistent arguments are rejected."""
+        arguments = {
+            "initial state": (State("q2"), [self.q0, self.q1], "ab", []),
+            "state": (self.q0, [self.q0], "ab", self.transitions),
+            "symbol": (self.q0, [self.q0, self.q1], "b", self.transitions),
+            "repeated state": (self.q0, [self.q0, self.q0], "ab", []),
+            "repeated symbol": (self.q0, [self.q0], "aa", []),
+            "repeated transition": (
+                self.q0,
+                [self.q0, self.q1],
+                "ab",
+                self.transitions * 2,
+            ),
+        }
+
+        for error, (initial_state, states, symbols, transitions) in (
+            arguments.items()
+        ):
+            with self.subTest(error=error):
+                with self.assertRaises(ValueError):
+                    FiniteAutomaton(
+                        initial_state=initial_state,
+                        states=states,
+                        symbols=symbols,
+                        transitions=transitions,
+                    )
+
+                # Sin validar no se comprueba nada
+                FiniteAutomaton(
+                    initial_state=initial_state,
+                    states=states,
+                    symbols=symbols,
+                    transitions=transitions,
+                    validate=False,
+                )
+
+
+class TestLiveStates(unittest.TestCase):
+    """Tests for the states that can reach a final state."""
+
+    def test_live_states(self) -> None:
+        """Test the co-reachable states."""
+        automaton = AutomataFormat.read(
+            """
+            Automaton:
+                Symbols: ab
+
+                q0
+                q1
+                q2 final
+                q3
+                q4
+
+                --> q0
+                q0 -a-> q1
+                q0 -b-> q3
+                q1 --> q2
+                q3 -a-> q3
+                q4 -b-> q0
+            """,
+        )
+
+        self.assertEqual(
+            {st.name for st in automaton.live_states()},
+            {"q0", "q1", "q2", "q4"},
+        )
+
+    def test_sink(self) -> None:
+        """Test that the sink of a deterministic automaton is not live."""
+        automaton = AutomataFormat.read(
+            """
+            Automaton:
+                Symbols: ab
+
+                q0
+                q1 final
+
+                --> q0
+                q0 -a-> q1
+            """,
+        ).to_deterministic()
+
+        self.assertIsNotNone(automaton.sumidero)
+        self.assertNotIn(automaton.sumidero, automaton.live_states())
+        self.assertEqual(len(automaton.live_states()), 2)
+
+
+class TestEpsilonClosure(unittest.TestCase):
+    """Tests for the lambda closures."""
+
+    def test_closure(self) -> None:
+        """Test closures with lambda cycles, computed only when asked."""
+        automaton = AutomataFormat.read(
+            """
+            Automaton:
+                Symbols: a
+
+                q0
+                q1
+                q2
+                q3 final
+
+                --> q0
+                q0 --> q1
+                q1 --> q2
+                q2 --> q1
+                q2 -a-> q3
+            """,
+        )
+        states = {st.name: st for st in automaton.states}
+
+        closure = automaton.epsilon_closure([states["q1"]])
+        self.assertEqual({st.name for st in closure}, {"q1", "q2"})
+        self.assertEqual(len(automaton._closures), 1)
+
+        # Las clausuras de varios estados no se guardan
+        closure = automaton.epsilon_closure([states["q0"], states["q3"]])
+        self.assertEqual(
+            {st.name for st in closure},
+            {"q0", "q1", "q2", "q3"},
+        )
+        self.assertEqual(len(automaton._closures), 1)
+
+        closure = automaton.epsilon_closure([states["q0"]])
+        self.assertEqual({st.name for st in closure}, {"q0", "q1", "q2"})
+        self.assertEqual(len(automaton._closures), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
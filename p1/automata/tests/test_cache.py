@@ -0,0 +1,62 @@
+"""Test the cache of automatas."""
+import unittest
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.cache import RegexCache
+from automata.re_parser import REParser
+from automata.utils import is_deterministic
+
+
+class TestRegexCache(unittest.TestCase):
+    """Tests for the LRU cache of regular expressions."""
+
+    def test_hits(self) -> None:
+        """Test that repeated expressions are reused."""
+        cache = RegexCache()
+
+        first = cache.create_automaton("a*.b")
+        second = cache.create_automaton("a*.b")
+        minimized = cache.create_minimized("a*.b")
+
+        self.assertEqual(first, second)
+        self.assertEqual(first, REParser().create_automaton("a*.b"))
+        self.assertTrue(is_deterministic(minimized))
+        self.assertEqual(cache.info().hits, 1)
+        self.assertEqual(cache.info().misses, 2)
+        self.assertEqual(cache.info().currsize, 2)
+
+        cache.clear()
+        self.assertEqual(tuple(cache.info()), (0, 0, cache.maxsize, 0))
+
+    def test_copies(self) -> None:
+        """Test that changing an automaton does not change the cache."""
+        cache = RegexCache()
+
+        first = cache.create_automaton("a.b")
+        first.to_deterministic()
+        self.assertIsNotNone(first.sumidero)
+        second = cache.create_automaton("a.b")
+
+        self.assertIsNot(first, second)
+        self.assertIsNone(second.sumidero)
+        self.assertEqual(second, REParser().create_automaton("a.b"))
+        self.assertTrue(FiniteAutomatonEvaluator(second).accepts("ab"))
+
+    def test_eviction(self) -> None:
+        """Test that the least recently used automaton is evicted."""
+        cache = RegexCache(maxsize=2)
+
+        cache.create_automaton("a")
+        cache.create_automaton("b")
+        cache.create_automaton("a")
+        cache.create_automaton("c")
+        cache.create_automaton("a")
+        cache.create_automaton("b")
+
+        self.assertEqual(cache.info().hits, 2)
+        self.assertEqual(cache.info().misses, 4)
+        self.assertEqual(cache.info().currsize, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Test the compact representation of automatas."""
+import unittest
+
+from automata.compact import LAMBDA, CompactAutomaton
+from automata.re_parser import REParser
+from automata.utils import AutomataFormat
+
+
+class TestCompact(unittest.TestCase):
+    """Tests for the integer-encoded automaton."""
+
+    def test_encoding(self) -> None:
+        """Test that states, symbols and transitions are numbered."""
+        automaton = AutomataFormat.read(
+            """
+            Automaton:
+                Symbols: ab
+
+                q0
+                q1
+                q2 final
+
+                --> q0
+                q0 -a-> q1
+                q0 -a-> q2
+                q0 --> q2
+                q1 -b-> q2
+            """,
+        )
+
+        compact = CompactAutomaton.from_automaton(automaton)
+        ids = {name: i for i, name in enumerate(compact.state_names)}
+        a = compact.symbol_ids["a"]
+        b = compact.symbol_ids["b"]
+
+        self.assertEqual(compact.num_states, 3)
+        self.assertEqual(compact.state_names[compact.initial_state], "q0")
+        self.assertTrue(compact.is_final(ids["q2"]))
+        self.assertFalse(compact.is_final(ids["q0"]))
+        self.assertEqual(
+            set(compact.successors(ids["q0"], a)),
+            {ids["q1"], ids["q2"]},
+        )
+        self.assertEqual(compact.successors(ids["q0"], b), [])
+        self.assertEqual(compact.successors(ids["q0"], LAMBDA), [ids["q2"]])
+        self.assertEqual(compact.successors(ids["q1"], b), [ids["q2"]])
+
+    def test_round_trip(self) -> None:
+        """Test that the conversion is lossless."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        automata = [
+            REParser().create_automaton(f"({num}.{num}*.,.{num}*)+{num}*"),
+            REParser().create_automaton("(a+b)*.c"),
+            REParser().create_automaton(""),
+        ]
+
+        for automaton in automata:
+            with self.subTest(automaton=automaton):
+                compact = CompactAutomaton.from_automaton(automaton)
+                self.assertEqual(compact.to_automaton(), automaton)
+
+
+if __name__ == "__main__":
+    unittest.main()
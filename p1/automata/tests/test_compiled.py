@@ -0,0 +1,135 @@
+"""Test compiled deterministic automatas."""
+import unittest
+
+import numpy as np
+
+from automata.compiled import PAD
+from automata.re_parser import REParser
+from automata.utils import AutomataFormat
+
+
+class TestCompiledDFA(unittest.TestCase):
+    """Tests for the table-driven matcher."""
+
+    def test_partial(self) -> None:
+        """Test a deterministic automaton without all transitions."""
+        automaton = AutomataFormat.read(
+            """
+            Automaton:
+                Symbols: Helo
+
+                Empty
+                H
+                He
+                Hel
+                Hell
+                Hello final
+
+                --> Empty
+                Empty -H-> H
+                H -e-> He
+                He -l-> Hel
+                Hel -l-> Hell
+                Hell -o-> Hello
+            """,
+        )
+        compiled = automaton.compile()
+
+        self.assertEqual(compiled.table.shape, (6, 4))
+        self.assertTrue(compiled.accepts("Hello"))
+        self.assertFalse(compiled.accepts("Helloo"))
+        self.assertFalse(compiled.accepts("Hell"))
+        self.assertFalse(compiled.accepts(""))
+        with self.assertRaises(ValueError):
+            compiled.accepts("Hella")
+
+    def test_immutable(self) -> None:
+        """Test that the tables cannot be modified."""
+        compiled = REParser().create_automaton("a*").to_deterministic().compile()
+
+        with self.assertRaises(ValueError):
+            compiled.table[0, 0] = 0
+
+    def test_not_deterministic(self) -> None:
+        """Test that only deterministic automata can be compiled."""
+        automaton = REParser().create_automaton("a.b")
+
+        with self.assertRaises(ValueError):
+            automaton.compile()
+
+    def test_number(self) -> None:
+        """Test number expression."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        compiled = REParser().create_automaton(
+            f"({num}.{num}*.,.{num}*)+{num}*",
+        ).to_deterministic().compile()
+
+        self.assertFalse(compiled.accepts(","))
+        self.assertTrue(compiled.accepts("1,7"))
+        self.assertTrue(compiled.accepts("25,73"))
+        self.assertTrue(compiled.accepts("5027"))
+        self.assertFalse(compiled.accepts(",13"))
+        self.assertTrue(compiled.accepts("13,"))
+        self.assertFalse(compiled.accepts("3,7,12"))
+
+    def test_batch(self) -> None:
+        """Test the acceptance of a batch of strings."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        compiled = REParser().create_automaton(
+            f"({num}.{num}*.,.{num}*)+{num}*",
+        ).to_deterministic().compile()
+        strings = [",", "1,7", "25,73", "5027", ",13", "13,", "3,7,12", ""]
+
+        accepted = compiled.accepts_batch(strings)
+
+        self.assertEqual(
+            accepted.tolist(),
+            [compiled.accepts(s) for s in strings],
+        )
+        self.assertEqual(
+            compiled.accepts_batch(compiled.encode(strings)).tolist(),
+            accepted.tolist(),
+        )
+        self.assertEqual(compiled.accepts_batch([]).tolist(), [])
+        with self.assertRaises(ValueError):
+            compiled.accepts_batch(["12", "1a"])
+
+    def test_batch_codes(self) -> None:
+        """Test the acceptance of a padded matrix of symbol codes."""
+        compiled = REParser().create_automaton("a.b*").to_deterministic().compile()
+        a = compiled.symbols.index("a")
+        b = compiled.symbols.index("b")
+        codes = np.array([
+            [a, b, b],
+            [a, PAD, PAD],
+            [b, a, PAD],
+            [PAD, PAD, PAD],
+        ])
+
+        self.assertEqual(
+            compiled.accepts_batch(codes).tolist(),
+            [True, True, False, False],
+        )
+        with self.assertRaises(ValueError):
+            compiled.accepts_batch(codes + 5)
+
+    def test_dead_state(self) -> None:
+        """Test strings rejected before reading them completely."""
+        compiled = REParser().create_automaton("a.b*").to_deterministic().compile()
+        strings = ["b" + "a" * 40, "abbb", "a" * 30 + "b", "ab" * 20]
+
+        self.assertFalse(compiled.accepts("ba" + "b" * 1000))
+        with self.assertRaises(ValueError):
+            compiled.accepts("ba" + "b" * 1000 + "c")
+        self.assertEqual(
+            compiled.accepts_batch(strings).tolist(),
+            [False, True, False, False],
+        )
+        self.assertEqual(
+            compiled.accepts_batch(strings[::2]).tolist(),
+            [False, False],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
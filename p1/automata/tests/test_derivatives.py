@@ -0,0 +1,107 @@
+"""Test regex derivatives."""
+import inspect
+import sys
+import unittest
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.derivatives import RegexDerivatives
+from automata.re_parser import REParser
+from automata.utils import deterministic_automata_isomorphism, is_deterministic
+
+
+class TestDerivatives(unittest.TestCase):
+    """Tests for the derivatives of regular expressions."""
+
+    def test_normalization(self) -> None:
+        """Test that equivalent expressions share the same id."""
+        regex = RegexDerivatives("(a+b)*.c")
+        a = regex.symbol("a")
+        b = regex.symbol("b")
+        c = regex.symbol("c")
+
+        self.assertEqual(regex.union(a, b), regex.union(b, a))
+        self.assertEqual(regex.union(a, regex.union(a, b)), regex.union(a, b))
+        self.assertEqual(
+            regex.concat(regex.concat(a, b), c),
+            regex.concat(a, regex.concat(b, c)),
+        )
+        self.assertEqual(regex.star(regex.star(a)), regex.star(a))
+        self.assertEqual(
+            regex.root,
+            regex.concat(regex.star(regex.union(b, a)), c),
+        )
+
+    def test_derivative(self) -> None:
+        """Test derivatives of a concatenation with a star."""
+        regex = RegexDerivatives("(a+b)*.c")
+        star = regex.star(regex.union(regex.symbol("a"), regex.symbol("b")))
+
+        self.assertEqual(regex.derivative(regex.root, "a"), regex.root)
+        self.assertEqual(regex.derivative(star, "b"), star)
+        self.assertTrue(regex.nullable(regex.derivative(regex.root, "c")))
+        self.assertFalse(regex.nullable(regex.root))
+
+    def test_lazy(self) -> None:
+        """Test matching without building the automaton."""
+        regex = RegexDerivatives("(a+b)*.a.(a+b).(a+b)")
+
+        self.assertTrue(regex.accepts("aab"))
+        self.assertTrue(regex.accepts("baabb"))
+        self.assertFalse(regex.accepts("abba"))
+        self.assertFalse(regex.accepts(""))
+        with self.assertRaises(ValueError):
+            regex.accepts("abc")
+
+    def test_minimal(self) -> None:
+        """Test that the automaton is deterministic and small."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        for regex in (
+            "a*.b*",
+            "(a+b)*.a.(a+b)",
+            f"({num}.{num}*.,.{num}*)+{num}*",
+        ):
+            with self.subTest(regex=regex):
+                automaton = RegexDerivatives(regex).to_automaton()
+                self.assertTrue(is_deterministic(automaton))
+                minimized = REParser().create_automaton(regex).to_minimized(
+                    "brzozowski",
+                )
+                self.assertIsNotNone(
+                    deterministic_automata_isomorphism(
+                        automaton.to_minimized(),
+                        minimized,
+                    ),
+                )
+                self.assertLessEqual(
+                    len(automaton.states),
+                    len(REParser().create_automaton(regex).to_deterministic().states),
+                )
+
+    def test_long(self) -> None:
+        """Test expressions longer than the recursion limit."""
+        length = 3 * sys.getrecursionlimit()
+        regex = ".".join("ab" * length)
+        word = "ab" * length
+
+        self.assertTrue(RegexDerivatives(regex).accepts(word))
+        self.assertFalse(RegexDerivatives(regex).accepts(word[:-1]))
+        automaton = REParser().create_automaton(regex, "derivatives")
+        self.assertTrue(FiniteAutomatonEvaluator(automaton).accepts(word))
+        # Un estado por prefijo de la palabra mas el sumidero
+        self.assertEqual(len(automaton.states), len(word) + 2)
+
+        # Todos los operandos aceptan la cadena vacia. Cada estado es la
+        # union de muchos sufijos, asi que bajamos el limite de recursion
+        # para usar una cadena corta
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(len(inspect.stack()) + 100)
+        try:
+            regex = ".".join(f"{s}*" for s in "ab" * 150)
+            self.assertTrue(RegexDerivatives(regex).accepts("ab" * 150))
+            self.assertFalse(RegexDerivatives(regex).accepts("ba" * 150))
+        finally:
+            sys.setrecursionlimit(limit)
+
+
+if __name__ == "__main__":
+    unittest.main()
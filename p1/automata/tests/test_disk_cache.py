@@ -0,0 +1,107 @@
+"""Test the persistent cache of automatas."""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from automata.disk_cache import DiskCache
+from automata.re_parser import REParser
+from automata.utils import (
+    BinaryAutomataFormat,
+    deterministic_automata_isomorphism,
+)
+
+
+class TestDiskCache(unittest.TestCase):
+    """Tests for the cache of minimized automata on disk."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.directory = os.path.join(self._tmp.name, "cache")
+
+    def test_regex(self) -> None:
+        """Test that a regex is minimized once and loaded afterwards."""
+        regex = "(a+b)*.a.(a+b)"
+        expected = REParser().create_automaton(regex).to_deterministic()
+        expected = expected.to_minimized()
+
+        first = DiskCache(self.directory).create_minimized(regex)
+        with mock.patch.object(REParser, "create_automaton") as create:
+            second = DiskCache(self.directory).create_minimized(regex)
+            create.assert_not_called()
+
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+        self.assertIsNotNone(deterministic_automata_isomorphism(first, expected))
+        self.assertEqual(first, second)
+
+    def test_description(self) -> None:
+        """Test that descriptions and regexes have different entries."""
+        description = """
+        Automaton:
+            Symbols: a
+
+            q0
+            q1 final
+            q2 final
+
+            --> q0
+            q0 -a-> q1
+            q1 -a-> q2
+            q2 -a-> q2
+        """
+        cache = DiskCache(self.directory)
+
+        first = cache.read_minimized(description)
+        second = cache.read_minimized(description)
+        cache.create_minimized("a")
+
+        self.assertEqual(len(first.states), 2)
+        self.assertEqual(first, second)
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+
+        cache.clear()
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_binary(self) -> None:
+        """Test that entries are stored in the binary format."""
+        cache = DiskCache(self.directory)
+
+        automaton = cache.create_minimized("a.b")
+        name, = os.listdir(self.directory)
+        compact = BinaryAutomataFormat.open(os.path.join(self.directory, name))
+        self.assertEqual(compact.to_automaton(), automaton)
+
+    def test_corrupted(self) -> None:
+        """Test that corrupted entries are rebuilt and overwritten."""
+        cache = DiskCache(self.directory)
+        expected = cache.create_minimized("a.b")
+        name, = os.listdir(self.directory)
+        path = os.path.join(self.directory, name)
+        with open(path, "rb") as f:
+            data = f.read()
+
+        for corrupted in (data[:len(data) // 2], b""):
+            with self.subTest(corrupted=corrupted):
+                with open(path, "wb") as f:
+                    f.write(corrupted)
+
+                self.assertEqual(cache.create_minimized("a.b"), expected)
+                with open(path, "rb") as f:
+                    self.assertEqual(f.read(), data)
+
+    def test_binary_version(self) -> None:
+        """Test that entries of other binary format versions are ignored."""
+        cache = DiskCache(self.directory)
+        cache.create_minimized("a.b")
+
+        with mock.patch.object(BinaryAutomataFormat, "version", 2):
+            automaton = cache.create_minimized("a.b")
+
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+        self.assertEqual(automaton, cache.create_minimized("a.b"))
+
+
+if __name__ == "__main__":
+    unittest.main()
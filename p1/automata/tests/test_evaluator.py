@@ -1,10 +1,17 @@
 """Test evaluation of automatas."""
+import io
 import unittest
 from abc import ABC, abstractmethod
-from typing import Optional, Type
-
-from automata.automaton import FiniteAutomaton
-from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from typing import Dict, Iterator, Optional, Type
+
+from automata.automaton import FiniteAutomaton, State
+from automata.automaton_evaluator import (
+    BitsetFiniteAutomatonEvaluator,
+    FiniteAutomatonEvaluator,
+    LazyFiniteAutomatonEvaluator,
+)
+from automata.interfaces import AbstractFiniteAutomatonEvaluator, StreamSource
+from automata.re_parser import REParser
 from automata.utils import AutomataFormat
 
 
@@ -12,7 +19,10 @@ class TestEvaluatorBase(ABC, unittest.TestCase):
     """Base class for string acceptance tests."""
 
     automaton: FiniteAutomaton
-    evaluator: FiniteAutomatonEvaluator
+    evaluator: AbstractFiniteAutomatonEvaluator[FiniteAutomaton, State]
+    evaluator_class: Type[
+        AbstractFiniteAutomatonEvaluator[FiniteAutomaton, State]
+    ] = FiniteAutomatonEvaluator
 
     @abstractmethod
     def _create_automata(self) -> FiniteAutomaton:
@@ -21,7 +31,7 @@ class TestEvaluatorBase(ABC, unittest.TestCase):
     def setUp(self) -> None:
         """Set up the tests."""
         self.automaton = self._create_automata()
-        self.evaluator = FiniteAutomatonEvaluator(self.automaton)
+        self.evaluator = self.evaluator_class(self.automaton)
 
     def _check_accept_body(
         self,
@@ -184,5 +194,135 @@ class TestEvaluatorDisconnected(TestEvaluatorBase):
         self._check_accept("Hella", exception=ValueError)
         self._check_accept("Helloa", exception=ValueError)
 
+
+class TestEvaluatorStream(TestEvaluatorBase):
+    """Test for strings read by chunks."""
+
+    def _create_automata(self) -> FiniteAutomaton:
+        automaton = REParser().create_automaton("a.ñ*.b")
+        return automaton.to_deterministic()
+
+    def test_sources(self) -> None:
+        """Test the kinds of input."""
+        encoded = "aññb".encode()
+        sources: Dict[str, StreamSource] = {
+            "string": "aññb",
+            "chunks": ["a", encoded[1:2], encoded[2:5], "b"],
+            "bytes": encoded,
+            "memoryview": memoryview(encoded),
+            "text file": io.StringIO("aññb"),
+            "binary file": io.BytesIO(encoded),
+        }
+
+        for name, source in sources.items():
+            with self.subTest(source=name):
+                self.assertTrue(
+                    self.evaluator.accepts_stream(source, chunk_size=2),
+                )
+
+        self.assertFalse(self.evaluator.accepts_stream(encoded[:-1]))
+        with self.assertRaises(UnicodeDecodeError):
+            self.evaluator.accepts_stream(encoded[:2])
+
+    def test_dead_state(self) -> None:
+        """Test that the input is not read after reaching a dead state."""
+        def chunks() -> Iterator[str]:
+            yield "ab"
+            yield "a"
+            raise AssertionError("Chunk read after a dead state")
+
+        self.assertFalse(self.evaluator.accepts_stream(chunks()))
+        self.assertFalse(self.evaluator.is_dead())
+
+        with self.assertRaises(ValueError):
+            self.evaluator.accepts_stream(["a", "?"])
+
+        self.evaluator.process_stream(["ab", "a", "?"])
+        self.assertTrue(self.evaluator.is_dead())
+
+    def test_dead_string(self) -> None:
+        """Test that the rest of a rejected string is still checked."""
+        self._check_accept("ba" + "ñ" * 100, should_accept=False)
+        self._check_accept("ba" + "ñ" * 100 + "?", exception=ValueError)
+        self._check_accept("añb", should_accept=True)
+
+
+class TestBitsetEvaluatorFixed(TestEvaluatorFixed):
+    """Test for a fixed string with the bitset evaluator."""
+
+    evaluator_class = BitsetFiniteAutomatonEvaluator
+
+
+class TestBitsetEvaluatorLambdas(TestEvaluatorLambdas):
+    """Test for only lambda transitions with the bitset evaluator."""
+
+    evaluator_class = BitsetFiniteAutomatonEvaluator
+
+
+class TestBitsetEvaluatorNumber(TestEvaluatorNumber):
+    """Test for a number string with the bitset evaluator."""
+
+    evaluator_class = BitsetFiniteAutomatonEvaluator
+
+
+class TestBitsetEvaluatorDisconnected(TestEvaluatorDisconnected):
+    """Test for a disconnected automata with the bitset evaluator."""
+
+    evaluator_class = BitsetFiniteAutomatonEvaluator
+
+    def test_current_states(self) -> None:
+        """Test that the mask is exposed as a set of states."""
+        self.assertEqual(
+            {st.name for st in self.evaluator.current_states},
+            {"q0"},
+        )
+        self.evaluator.process_symbol("a")
+        self.assertEqual(self.evaluator.current_states, set())
+
+
+class TestLazyEvaluatorFixed(TestEvaluatorFixed):
+    """Test for a fixed string with the lazy evaluator."""
+
+    evaluator_class = LazyFiniteAutomatonEvaluator
+
+
+class TestLazyEvaluatorLambdas(TestEvaluatorLambdas):
+    """Test for only lambda transitions with the lazy evaluator."""
+
+    evaluator_class = LazyFiniteAutomatonEvaluator
+
+
+class TestLazyEvaluatorNumber(TestEvaluatorNumber):
+    """Test for a number string with the lazy evaluator."""
+
+    evaluator_class = LazyFiniteAutomatonEvaluator
+
+    def test_small_cache(self) -> None:
+        """Test that evicted states are computed again."""
+        self.evaluator = LazyFiniteAutomatonEvaluator(
+            self.automaton,
+            cache_size=1,
+        )
+        self.test_number()
+
+
+class TestLazyEvaluatorDisconnected(TestEvaluatorDisconnected):
+    """Test for a disconnected automata with the lazy evaluator."""
+
+    evaluator_class = LazyFiniteAutomatonEvaluator
+
+
+class TestBitsetEvaluatorStream(TestEvaluatorStream):
+    """Test for strings read by chunks with bitmasks."""
+
+    evaluator_class = BitsetFiniteAutomatonEvaluator
+
+
+class TestLazyEvaluatorStream(TestEvaluatorStream):
+    """Test for strings read by chunks with lazy determinization."""
+
+    evaluator_class = LazyFiniteAutomatonEvaluator
+
+
 if __name__ == '__main__':
     unittest.main()
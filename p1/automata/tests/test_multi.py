@@ -0,0 +1,69 @@
+"""Test the matching of many patterns at once."""
+import itertools
+import unittest
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.multi import MultiPatternMatcher
+from automata.re_parser import REParser
+from automata.utils import AutomataFormat
+
+
+class TestMultiPattern(unittest.TestCase):
+    """Tests for the multi-pattern matcher."""
+
+    def test_matches(self) -> None:
+        """Test that every matching pattern is reported."""
+        patterns = ["a.b*", "(a+b)*.b", "a.b", "c", "λ"]
+        matcher = MultiPatternMatcher(patterns)
+        evaluators = [
+            FiniteAutomatonEvaluator(REParser().create_automaton(p))
+            for p in patterns
+        ]
+
+        for length in range(5):
+            for symbols in itertools.product("abc", repeat=length):
+                string = "".join(symbols)
+                expected = {
+                    i for i, evaluator in enumerate(evaluators)
+                    if set(string) <= set(evaluator.automaton.symbols)
+                    and evaluator.accepts(string)
+                }
+                with self.subTest(string=string):
+                    self.assertEqual(matcher.matches(string), expected)
+
+    def test_same_names(self) -> None:
+        """Test automata whose states have the same names."""
+        description = """
+        Automaton:
+            Symbols: ab
+
+            q0
+            q1 final
+
+            --> q0
+            q0 -{}-> q1
+        """
+        matcher = MultiPatternMatcher([
+            AutomataFormat.read(description.format("a")),
+            AutomataFormat.read(description.format("b")),
+            AutomataFormat.read(description.format("a")),
+        ])
+
+        self.assertEqual(matcher.matches("a"), {0, 2})
+        self.assertEqual(matcher.matches("b"), {1})
+        self.assertEqual(matcher.matches("ab"), set())
+
+    def test_invalid_symbol(self) -> None:
+        """Test symbols outside every alphabet."""
+        matcher = MultiPatternMatcher(["a.b", "b*"])
+
+        self.assertEqual(matcher.matches("ba" * 50), set())
+        with self.assertRaises(ValueError):
+            matcher.matches("ab" + "ba" * 50 + "c")
+        with self.assertRaises(ValueError):
+            MultiPatternMatcher([]).matches("a")
+        self.assertEqual(MultiPatternMatcher([]).matches(""), set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""Test the product operations of automatas."""
+import itertools
+import unittest
+from typing import Callable
+
+from automata.automaton import FiniteAutomaton
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from automata.utils import deterministic_automata_isomorphism, is_deterministic
+
+
+class TestProduct(unittest.TestCase):
+    """Tests for intersection, difference and complement."""
+
+    def _check_language(
+        self,
+        automaton: FiniteAutomaton,
+        language: Callable[[str], bool],
+        symbols: str = "abc",
+    ) -> None:
+        self.assertTrue(is_deterministic(automaton))
+        evaluator = FiniteAutomatonEvaluator(automaton)
+        for length in range(6):
+            for string in itertools.product(symbols, repeat=length):
+                with self.subTest(string="".join(string)):
+                    self.assertEqual(
+                        evaluator.accepts("".join(string)),
+                        language("".join(string)),
+                    )
+
+    def test_operations(self) -> None:
+        """Test the languages of the operations."""
+        # Cadenas con algun b y cadenas de longitud par
+        automaton1 = REParser().create_automaton("(a+b+c)*.b.(a+b+c)*")
+        automaton2 = REParser().create_automaton(
+            "((a+b+c).(a+b+c))*",
+            "glushkov",
+        )
+
+        for minimize in (False, True):
+            with self.subTest(minimize=minimize):
+                self._check_language(
+                    automaton1.intersection(automaton2, minimize=minimize),
+                    lambda s: "b" in s and len(s) % 2 == 0,
+                )
+                self._check_language(
+                    automaton1.difference(automaton2, minimize=minimize),
+                    lambda s: "b" in s and len(s) % 2 == 1,
+                )
+                self._check_language(
+                    automaton1.symmetric_difference(
+                        automaton2,
+                        minimize=minimize,
+                    ),
+                    lambda s: ("b" in s) != (len(s) % 2 == 0),
+                )
+                self._check_language(
+                    automaton1.complement(minimize=minimize),
+                    lambda s: "b" not in s,
+                )
+
+    def test_alphabets(self) -> None:
+        """Test automata with different alphabets."""
+        automaton1 = REParser().create_automaton("a*")
+        automaton2 = REParser().create_automaton("(a+b).c")
+
+        self._check_language(
+            automaton1.symmetric_difference(automaton2),
+            lambda s: set(s) <= {"a"} or s in {"ac", "bc"},
+        )
+        self._check_language(
+            automaton1.complement("bc"),
+            lambda s: not set(s) <= {"a"},
+        )
+
+    def test_minimize(self) -> None:
+        """Test that minimized results are minimal."""
+        automaton1 = REParser().create_automaton("(a+b)*.a.(a+b)")
+        automaton2 = REParser().create_automaton("a.(a+b)*")
+
+        product = automaton1.intersection(automaton2)
+        minimized = automaton1.intersection(automaton2, minimize=True)
+        self.assertIsNotNone(
+            deterministic_automata_isomorphism(
+                minimized,
+                product.to_minimized(),
+            ),
+        )
+        self.assertLessEqual(len(minimized.states), len(product.states))
+
+    def test_empty(self) -> None:
+        """Test that dead pairs are merged in the sink."""
+        automaton1 = REParser().create_automaton("a.a*")
+        automaton2 = REParser().create_automaton("b.b*")
+
+        intersection = automaton1.intersection(automaton2)
+        self.assertEqual(len(intersection.states), 2)
+        self.assertIsNotNone(intersection.sumidero)
+        self.assertFalse(any(st.is_final for st in intersection.states))
+
+        for automaton in (
+            automaton1.intersection(automaton2, minimize=True),
+            automaton1.difference(automaton1, minimize=True),
+        ):
+            with self.subTest(automaton=automaton):
+                self.assertEqual(len(automaton.states), 1)
+                self.assertFalse(automaton.initial_state.is_final)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,8 +8,10 @@ from automata.re_parser import REParser
 class TestREParser(unittest.TestCase):
     """Tests for regex parser."""
 
+    algorithm = "thompson"
+
     def _create_evaluator(self, regex: str) -> FiniteAutomatonEvaluator:
-        automaton = REParser().create_automaton(regex)
+        automaton = REParser().create_automaton(regex, self.algorithm)
         return FiniteAutomatonEvaluator(automaton)
 
     def _check_accept(
@@ -80,5 +82,104 @@ class TestREParser(unittest.TestCase):
         self._check_accept(evaluator, "3,7,12", should_accept=False)
 
 
+class TestREParserLinear(TestREParser):
+    """Tests for the linear-time construction."""
+
+    algorithm = "linear"
+
+    def test_same_automaton(self) -> None:
+        """Test that both constructions give automata of the same size."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        for regex in ("", "λ", "λ*", "a*.b*", f"({num}.{num}*.,.{num}*)+{num}*"):
+            with self.subTest(regex=regex):
+                thompson = REParser().create_automaton(regex)
+                linear = REParser().create_automaton(regex, "linear")
+                self.assertEqual(len(linear.states), len(thompson.states))
+                self.assertEqual(
+                    len(linear.transitions),
+                    len(thompson.transitions),
+                )
+                self.assertEqual(set(linear.symbols), set(thompson.symbols))
+
+    def test_operands_unchanged(self) -> None:
+        """Test that composing automata does not modify them."""
+        parser = REParser()
+        automaton1 = parser.create_automaton("a.b")
+        automaton2 = parser.create_automaton("c*")
+        states = [*automaton1.states, *automaton2.states]
+
+        for automaton in (
+            parser._create_automaton_star(automaton1),
+            parser._create_automaton_union(automaton1, automaton2),
+            parser._create_automaton_concat(automaton1, automaton2),
+        ):
+            with self.subTest(automaton=automaton):
+                self.assertEqual(
+                    [*automaton1.states, *automaton2.states],
+                    states,
+                )
+                self.assertEqual(automaton1, parser.create_automaton("a.b"))
+
+    def test_shared_names(self) -> None:
+        """Test composing automata whose states have the same names."""
+        parser = REParser()
+        automaton = parser.create_automaton("a.b")
+
+        union = parser._create_automaton_union(automaton, automaton)
+        concat = parser._create_automaton_concat(automaton, automaton)
+
+        self.assertEqual(len(union.states), 2 * len(automaton.states) + 2)
+        self.assertEqual(len(concat.states), 2 * len(automaton.states))
+        self.assertTrue(FiniteAutomatonEvaluator(union).accepts("ab"))
+        self.assertTrue(FiniteAutomatonEvaluator(concat).accepts("abab"))
+        self.assertFalse(FiniteAutomatonEvaluator(concat).accepts("ab"))
+
+    def test_unknown_algorithm(self) -> None:
+        """Test that unknown algorithms are rejected."""
+        with self.assertRaises(ValueError):
+            REParser().create_automaton("a", "unknown")
+
+
+class TestREParserGlushkov(TestREParser):
+    """Tests for the position automaton construction."""
+
+    algorithm = "glushkov"
+
+    def test_positions(self) -> None:
+        """Test that there is one state per symbol plus the initial one."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        for regex, positions in (
+            ("", 0),
+            ("λ", 0),
+            ("λ*.a", 1),
+            ("a*.b*", 2),
+            (f"({num}.{num}*.,.{num}*)+{num}*", 41),
+        ):
+            with self.subTest(regex=regex):
+                automaton = REParser().create_automaton(regex, "glushkov")
+                self.assertEqual(len(automaton.states), positions + 1)
+                self.assertTrue(
+                    all(tr.symbol is not None for tr in automaton.transitions),
+                )
+
+    def test_lambda(self) -> None:
+        """Test expressions that accept the empty string."""
+        evaluator = self._create_evaluator("λ+a.b")
+
+        self._check_accept(evaluator, "", should_accept=True)
+        self._check_accept(evaluator, "ab", should_accept=True)
+        self._check_accept(evaluator, "a", should_accept=False)
+
+        evaluator = self._create_evaluator("")
+
+        self._check_accept(evaluator, "", should_accept=False)
+
+
+class TestREParserDerivatives(TestREParser):
+    """Tests for the construction with derivatives."""
+
+    algorithm = "derivatives"
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,105 @@
+"""Test the search of substrings accepted by automatas."""
+import random
+import string
+import unittest
+from typing import List
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from automata.search import FiniteAutomatonSearcher, Span
+
+
+class TestSearch(unittest.TestCase):
+    """Tests for the leftmost-longest search."""
+
+    def _brute_force(self, regex: str, text: str) -> List[Span]:
+        evaluator = FiniteAutomatonEvaluator(
+            REParser().create_automaton(regex),
+        )
+        symbols = set(evaluator.automaton.symbols)
+
+        def accepts(start: int, end: int) -> bool:
+            substring = text[start:end]
+            return set(substring) <= symbols and evaluator.accepts(substring)
+
+        spans = []
+        pos = 0
+        while pos <= len(text):
+            span = next(
+                (
+                    (start, max(
+                        end for end in range(start, len(text) + 1)
+                        if accepts(start, end)
+                    ))
+                    for start in range(pos, len(text) + 1)
+                    if any(
+                        accepts(start, end)
+                        for end in range(start, len(text) + 1)
+                    )
+                ),
+                None,
+            )
+            if span is None:
+                break
+            spans.append(span)
+            pos = span[1] if span[1] > span[0] else span[0] + 1
+        return spans
+
+    def test_words(self) -> None:
+        """Test the search of words in a line."""
+        letter = "+".join(string.ascii_lowercase)
+        searcher = FiniteAutomatonSearcher(
+            REParser().create_automaton(f"({letter}).({letter})*"),
+        )
+        text = "user 42 logged in, then out"
+
+        self.assertEqual(
+            [text[start:end] for start, end in searcher.finditer(text)],
+            ["user", "logged", "in", "then", "out"],
+        )
+        self.assertEqual(searcher.search(text, 4), (8, 14))
+        self.assertIsNone(searcher.search("42 + 7"))
+
+    def test_empty_matches(self) -> None:
+        """Test languages with the empty string."""
+        searcher = FiniteAutomatonSearcher(
+            REParser().create_automaton("a*"),
+        )
+
+        self.assertEqual(
+            searcher.findall("baac"),
+            [(0, 0), (1, 3), (3, 3), (4, 4)],
+        )
+        self.assertEqual(searcher.findall(""), [(0, 0)])
+
+    def test_longest(self) -> None:
+        """Test that the longest match is found without rescanning."""
+        searcher = FiniteAutomatonSearcher(
+            REParser().create_automaton("a*.b+a"),
+        )
+
+        self.assertEqual(searcher.findall("aaab"), [(0, 4)])
+        self.assertEqual(searcher.findall("a" * 1000), [
+            (i, i + 1) for i in range(1000)
+        ])
+
+    def test_random(self) -> None:
+        """Test against a brute force search."""
+        rng = random.Random(0)
+        for regex in ("a.b*", "(a+b)*.a.b", "a.a+b", "λ", "", "(a.b+b)*.c"):
+            searcher = FiniteAutomatonSearcher(
+                REParser().create_automaton(regex),
+            )
+            for _ in range(50):
+                text = "".join(
+                    rng.choice("abcx") for _ in range(rng.randrange(10))
+                )
+                with self.subTest(regex=regex, text=text):
+                    self.assertEqual(
+                        searcher.findall(text),
+                        self._brute_force(regex, text),
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 """Test evaluation of automatas."""
 import unittest
 from abc import ABC
+from typing import Set
 
 from automata.automaton import FiniteAutomaton
 from automata.utils import AutomataFormat, deterministic_automata_isomorphism, write_dot
@@ -598,5 +599,97 @@ class TestTransform(ABC, unittest.TestCase):
 
         self._check_transform(automaton, expected)
 
+    def test_name_collision(self) -> None:
+        """Comprobamos que subconjuntos distintos cuyos nombres concatenados
+        coinciden (a+bc y ab+c) dan estados distintos."""
+        automaton_str = """
+        Automaton:
+            Symbols: xy
+
+            s
+            a
+            bc
+            ab
+            c
+            f final
+
+            --> s
+            s -x-> a
+            s -x-> bc
+            s -y-> ab
+            s -y-> c
+            a -x-> f
+        """
+
+        automaton = AutomataFormat.read(automaton_str)
+
+        expected_str = """
+        Automaton:
+            Symbols: xy
+
+            s
+            abc1
+            abc2
+            f final
+            empty
+
+            --> s
+            s -x-> abc1
+            s -y-> abc2
+            abc1 -x-> f
+            abc1 -y-> empty
+            abc2 -x-> empty
+            abc2 -y-> empty
+            f -x-> empty
+            f -y-> empty
+            empty -x-> empty
+            empty -y-> empty
+        """
+
+        expected = AutomataFormat.read(expected_str)
+
+        self._check_transform(automaton, expected)
+
+
+class TestEpsilonClosure(unittest.TestCase):
+    """Tests for the precomputed lambda closures."""
+
+    def test_cycles(self) -> None:
+        """Test closures of states in and out of lambda cycles."""
+        automaton = AutomataFormat.read(
+            """
+            Automaton:
+                Symbols: a
+
+                q0
+                q1
+                q2
+                q3
+                q4 final
+
+                --> q0
+                q0 --> q1
+                q1 --> q2
+                q2 --> q1
+                q2 --> q3
+                q3 -a-> q0
+                q4 --> q4
+            """,
+        )
+
+        def names(*states: str) -> Set[str]:
+            closure = automaton.epsilon_closure(
+                st for st in automaton.states if st.name in states
+            )
+            return {st.name for st in closure}
+
+        self.assertEqual(names("q0"), {"q0", "q1", "q2", "q3"})
+        self.assertEqual(names("q1"), {"q1", "q2", "q3"})
+        self.assertEqual(names("q2"), {"q1", "q2", "q3"})
+        self.assertEqual(names("q3"), {"q3"})
+        self.assertEqual(names("q3", "q4"), {"q3", "q4"})
+        self.assertEqual(names(), set())
+
+
 if __name__ == '__main__':
     unittest.main()
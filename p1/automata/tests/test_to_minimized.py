@@ -1,21 +1,26 @@
 """Test evaluation of automatas."""
+import random
 import unittest
 from abc import ABC
 
-from automata.automaton import FiniteAutomaton
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
 from automata.utils import AutomataFormat, deterministic_automata_isomorphism, write_dot
 
 
 class TestTransform(ABC, unittest.TestCase):
     """Base class for string acceptance tests."""
 
+    algorithm = "hopcroft"
+
     def _check_transform(
         self,
         automaton: FiniteAutomaton,
         expected: FiniteAutomaton,
     ) -> None:
         """Test that the transformed automaton is as the expected one."""
-        transformed = automaton.to_minimized()
+        transformed = automaton.to_minimized(self.algorithm)
 
         equiv_map = deterministic_automata_isomorphism(
             expected,
@@ -457,5 +462,123 @@ class TestTransform(ABC, unittest.TestCase):
 
         self._check_transform(automaton, expected)
 
+
+class TestTransformTable(TestTransform):
+    """Same cases with the table-filling algorithm."""
+
+    algorithm = "table"
+
+    def test_cross_check(self) -> None:
+        """Comprobamos que Hopcroft y el algoritmo de la tabla coinciden
+        en autómatas deterministas completos aleatorios."""
+        rng = random.Random(0)
+        for _ in range(50):
+            num_states = rng.randint(1, 12)
+            states = [State(f"q{i}", is_final=rng.random() < 0.3)
+                      for i in range(num_states)]
+            transitions = [
+                Transition(st, symbol, rng.choice(states))
+                for st in states
+                for symbol in "ab"
+            ]
+            automaton = FiniteAutomaton(
+                initial_state=states[0],
+                states=states,
+                symbols="ab",
+                transitions=transitions,
+            )
+
+            with self.subTest(automaton=AutomataFormat.write(automaton)):
+                equiv_map = deterministic_automata_isomorphism(
+                    automaton.to_minimized("table"),
+                    automaton.to_minimized("hopcroft"),
+                )
+                self.assertTrue(equiv_map is not None)
+
+    def test_unknown_algorithm(self) -> None:
+        """Comprobamos que se rechazan algoritmos desconocidos."""
+        automaton = AutomataFormat.read(
+            """
+            Automaton:
+                Symbols:
+
+                q0
+
+                --> q0
+            """,
+        )
+
+        with self.assertRaises(ValueError):
+            automaton.to_minimized("unknown")
+
+
+class TestTransformBrzozowski(unittest.TestCase):
+    """Tests for the minimization by double reversal."""
+
+    def test_reverse(self) -> None:
+        """Comprobamos que el inverso acepta las cadenas al revés."""
+        automaton = AutomataFormat.read(
+            """
+            Automaton:
+                Symbols: ab
+
+                q0
+                q1
+                q2 final
+                q3 final
+
+                --> q0
+                q0 -a-> q1
+                q1 -b-> q2
+                q1 --> q3
+                q3 -b-> q3
+            """,
+        )
+        evaluator = FiniteAutomatonEvaluator(automaton.reverse())
+
+        for string in ("", "a", "ab", "abb", "ba", "bba", "aab", "bab"):
+            with self.subTest(string=string):
+                self.assertEqual(
+                    evaluator.accepts(string),
+                    FiniteAutomatonEvaluator(automaton).accepts(string[::-1]),
+                )
+
+    def test_regex(self) -> None:
+        """Comprobamos que coincide con determinizar y minimizar."""
+        num = "(0+1+2+3+4+5+6+7+8+9)"
+        for regex in ("a*.b*", "(a+b)*.a.(a+b)", f"({num}.{num}*.,.{num}*)+{num}*"):
+            automaton = REParser().create_automaton(regex)
+            with self.subTest(regex=regex):
+                equiv_map = deterministic_automata_isomorphism(
+                    automaton.to_deterministic().to_minimized(),
+                    automaton.to_minimized("brzozowski"),
+                )
+                self.assertTrue(equiv_map is not None)
+
+    def test_empty_language(self) -> None:
+        """Comprobamos el autómata sin estados finales."""
+        automaton = REParser().create_automaton("")
+
+        minimized = automaton.to_minimized("brzozowski")
+
+        self.assertEqual(len(minimized.states), 1)
+        self.assertFalse(minimized.initial_state.is_final)
+
+        automaton = REParser().create_automaton("a.b")
+        automaton = FiniteAutomaton(
+            initial_state=automaton.initial_state,
+            states=automaton.states,
+            symbols=automaton.symbols,
+            transitions=[
+                tr for tr in automaton.transitions if tr.symbol != "b"
+            ],
+        )
+
+        minimized = automaton.to_minimized("brzozowski")
+
+        self.assertEqual(len(minimized.states), 1)
+        self.assertFalse(minimized.initial_state.is_final)
+
+
 if __name__ == '__main__':
     unittest.main()
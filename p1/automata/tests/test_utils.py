@@ -0,0 +1,176 @@
+"""Test utilities to work with automatas."""
+import io
+import os
+import tempfile
+import unittest
+
+from automata.compiled import CompiledDFA
+from automata.re_parser import REParser
+from automata.utils import (
+    AutomataFormat,
+    BinaryAutomataFormat,
+    FormatParseError,
+    write_dot,
+    write_dot_stream,
+)
+
+
+class TestReadFormat(unittest.TestCase):
+    """Tests for the parser of the text format."""
+
+    def test_spacing(self) -> None:
+        """Test lines with unusual spacing."""
+        automaton = AutomataFormat.read(
+            """
+            Automaton:
+                Symbols:ab
+                q0
+                q1   final
+                -->q0
+                q0-a->q1
+                q1 --> q0
+                q1  -b->  q1
+            """,
+        )
+        expected = AutomataFormat.read(
+            """
+            Automaton:
+                Symbols: ab
+                q0
+                q1 final
+                --> q0
+                q0 -a-> q1
+                q1 --> q0
+                q1 -b-> q1
+            """,
+        )
+
+        self.assertEqual(automaton, expected)
+        self.assertEqual(len(automaton.transitions), 3)
+
+    def test_errors(self) -> None:
+        """Test that inconsistent descriptions are rejected."""
+        descriptions = {
+            "undefined state": "Symbols: a\nq0\n--> q0\nq0 -a-> q1",
+            "unknown symbol": "Symbols: a\nq0\n--> q0\nq0 -b-> q0",
+            "repeated symbols": "Symbols: aa\nq0\n--> q0",
+            "invalid name": "Symbols: a\nq0\n--> q0\nq0 -a-> q$",
+            "no initial state": "Symbols: a\nq0",
+        }
+
+        for error, description in descriptions.items():
+            with self.subTest(error=error):
+                with self.assertRaises(FormatParseError):
+                    AutomataFormat.read("Automaton:\n" + description)
+
+
+class TestStreamFormat(unittest.TestCase):
+    """Tests for reading and writing the text formats line by line."""
+
+    def test_round_trip(self) -> None:
+        """Test that the streaming variants match the string ones."""
+        automaton = REParser().create_automaton("(a+b)*.c+λ")
+
+        output = io.StringIO()
+        AutomataFormat.write_stream(automaton, output)
+        self.assertEqual(output.getvalue(), AutomataFormat.write(automaton))
+
+        output.seek(0)
+        self.assertEqual(AutomataFormat.read_stream(output), automaton)
+
+        output = io.StringIO()
+        write_dot_stream(automaton, output)
+        self.assertEqual(output.getvalue(), write_dot(automaton))
+
+    def test_file(self) -> None:
+        """Test reading from a text file."""
+        automaton = REParser().create_automaton("a.b*")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "automaton.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                AutomataFormat.write_stream(automaton, f)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(AutomataFormat.read_stream(f), automaton)
+
+    def test_invalid_line(self) -> None:
+        """Test that the line ending is not part of the error."""
+        with self.assertRaisesRegex(FormatParseError, "Invalid line: q0 -$"):
+            AutomataFormat.read_stream(["Automaton:\n", "q0 -\n"])
+
+
+class TestBinaryFormat(unittest.TestCase):
+    """Tests for the binary format."""
+
+    def test_round_trip(self) -> None:
+        """Test that writing and reading keeps the automaton."""
+        automaton = AutomataFormat.read(
+            """
+            Automaton:
+                Symbols: 01-.
+
+                initial
+                sign
+                int final
+                dot
+                decimal final
+
+                --> initial
+                initial ---> sign
+                initial --> sign
+                sign -0-> int
+                sign -1-> int
+                int -0-> int
+                int -1-> int
+                int -.-> dot
+                dot -0-> decimal
+                dot -1-> decimal
+                decimal -0-> decimal
+                decimal -1-> decimal
+            """,
+        )
+
+        data = BinaryAutomataFormat.write(automaton)
+        compact = BinaryAutomataFormat.read(data)
+
+        self.assertEqual(compact.to_automaton(), automaton)
+        self.assertEqual(compact.state_names[-1], "decimal")
+        self.assertEqual(list(compact.state_names[1:3]), ["sign", "int"])
+
+    def test_mmap(self) -> None:
+        """Test matching over a mapped file."""
+        automaton = REParser().create_automaton("(a+b)*.a.(a+b)")
+        automaton = automaton.to_deterministic().to_minimized()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "automaton.bin")
+            with open(path, "wb") as f:
+                f.write(BinaryAutomataFormat.write(automaton))
+
+            compact = BinaryAutomataFormat.open(path)
+            compiled = CompiledDFA.from_compact(compact)
+            for string in ("", "a", "aa", "ab", "ba", "bab", "abb"):
+                with self.subTest(string=string):
+                    expected = len(string) >= 2 and string[-2] == "a"
+                    self.assertEqual(compact.accepts(string), expected)
+                    self.assertEqual(compiled.accepts(string), expected)
+
+            with self.assertRaises(ValueError):
+                compact.accepts("abc")
+
+            del compact, compiled
+
+    def test_invalid(self) -> None:
+        """Test that invalid data is rejected."""
+        data = BinaryAutomataFormat.write(REParser().create_automaton("a"))
+
+        with self.assertRaises(FormatParseError):
+            BinaryAutomataFormat.read(b"XXXX" + data[4:])
+        with self.assertRaises(FormatParseError):
+            BinaryAutomataFormat.read(data[:-1])
+        with self.assertRaises(FormatParseError):
+            BinaryAutomataFormat.read(data[:8])
+
+
+if __name__ == "__main__":
+    unittest.main()
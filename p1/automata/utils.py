@@ -1,11 +1,30 @@
 """General utilities to work with automatas."""
+import io
+import mmap
 import re
+import struct
+import sys
+from array import array
 from collections import defaultdict, deque
-from typing import DefaultDict, Dict, Mapping, Optional, Set
+from typing import (
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+    overload,
+)
 
 from typing_extensions import Final
 
 import automata.automaton as aut
+from automata.compact import CompactAutomaton
 
 
 class FormatParseError(Exception):
@@ -22,99 +41,391 @@ class AutomataFormat():
     re_initial: Final = re.compile(r"\s*-->\s*(\w+)\s*")
     re_transition: Final = re.compile(r"\s*(\w+)\s*-(\S)?->\s*(\w+)\s*")
     re_symbols: Final = re.compile(r"\s*Symbols:\s*(\S*)\s*")
+    re_name: Final = re.compile(r"\w+")
 
     @classmethod
     def read(cls, description: str) -> aut.FiniteAutomaton:
         """Read the automaton description in our custom format."""
-        splitted_lines = description.splitlines()
-        prelude_read = False
+        return cls.read_stream(description.splitlines())
 
-        initial_state: Optional[aut.State] = None
-        states: Dict[str, aut.State] = {}
-        transitions: Set[aut.Transition] = set()
+    @classmethod
+    def read_stream(cls, lines: Iterable[str]) -> aut.FiniteAutomaton:
+        """
+        Read the automaton description in our custom format line by line.
 
-        for line in splitted_lines:
-            if cls.re_comment.fullmatch(line) or cls.re_empty.fullmatch(line):
-                continue
+        Each line is classified by its tokens in a single pass, trying the
+        regular expressions only for unusual spacing. State names are
+        numbered as they appear, and the automaton is built once at the end
+        without validating again what the parser already checked.
 
-            if prelude_read:
-                match = cls.re_symbols.fullmatch(line)
-                if match:
-                    symbols_str = match.groups()[0]
-                    symbols = tuple(symbols_str)
-                    continue
+        Args:
+            lines: Lines of the description, such as an open text file.
 
-                match = cls.re_state.fullmatch(line)
-                if match:
-                    state_name, final_text = match.groups()
-                    states[state_name] = aut.State(
-                        name=state_name,
-                        is_final=bool(final_text),
-                    )
-                    continue
+        Returns:
+            The automaton described.
 
-                match = cls.re_initial.fullmatch(line)
-                if match:
-                    state_name = match.groups()[0]
-                    initial_state = states[state_name]
-                    continue
+        """
+        prelude_read = False
 
-                match = cls.re_transition.fullmatch(line)
-                if match:
-                    state1_name, symbol, state2_name = match.groups()
+        symbols: Tuple[str, ...] = ()
+        initial_state: Optional[int] = None
+        state_ids: Dict[str, int] = {}
+        names: List[str] = []
+        # Si cada estado es final, o None si aun no se ha declarado
+        finals: List[Optional[bool]] = []
+        edges: Set[Tuple[int, Optional[str], int]] = set()
+
+        def state_id(name: str) -> int:
+            """Devuelve el numero del estado, o -1 si el nombre no es valido."""
+            i = state_ids.get(name)
+            if i is None:
+                if not cls.re_name.fullmatch(name):
+                    return -1
+                i = state_ids[name] = len(names)
+                names.append(name)
+                finals.append(None)
+            return i
+
+        def read_tokens(tokens: Sequence[str]) -> bool:
+            """Procesa una linea ya separada. Devuelve si era valida."""
+            nonlocal symbols, initial_state
+
+            first = tokens[0]
+            n_tokens = len(tokens)
+            if n_tokens == 3:
+                arrow = tokens[1]
+                if (
+                    len(arrow) in {3, 4}
+                    and arrow[0] == "-"
+                    and arrow[-2:] == "->"
+                ):
+                    state1 = state_id(first)
+                    state2 = state_id(tokens[2])
+                    if state1 < 0 or state2 < 0:
+                        return False
+                    edges.add((
+                        state1,
+                        arrow[1] if len(arrow) == 4 else None,
+                        state2,
+                    ))
+                    return True
+
+            elif first == "-->":
+                if n_tokens != 2:
+                    return False
+                initial_state = state_id(tokens[1])
+                return initial_state >= 0
+
+            elif first == "Symbols:":
+                if n_tokens > 2:
+                    return False
+                symbols = tuple(tokens[1]) if n_tokens == 2 else ()
+                return True
+
+            elif n_tokens == 1 or (n_tokens == 2 and tokens[1] == "final"):
+                i = state_id(first)
+                if i < 0:
+                    return False
+                finals[i] = n_tokens == 2
+                return True
 
-                    state1 = states[state1_name]
-                    state2 = states[state2_name]
+            return False
 
-                    transitions.add(aut.Transition(
-                        initial_state=state1,
-                        symbol=symbol,
-                        final_state=state2,
-                    ))
+        for line in lines:
+            # Los ficheros devuelven las lineas con el salto de linea
+            line = line.rstrip("\r\n")
+            tokens = line.split()
+            if not tokens or tokens[0][0] == "#":
+                continue
+
+            if not prelude_read:
+                if cls.re_automaton.fullmatch(line):
+                    prelude_read = True
                     continue
 
-            elif cls.re_automaton.fullmatch(line):
-                prelude_read = True
+            elif read_tokens(tokens):
                 continue
 
+            else:
+                normalized = cls._normalize(line)
+                if normalized and read_tokens(normalized):
+                    continue
+
             raise FormatParseError(f"Invalid line: {line}")
 
         if initial_state is None:
             raise FormatParseError("No initial state defined")
 
+        for name, final in zip(names, finals):
+            if final is None:
+                raise FormatParseError(f"State {name} is not defined")
+
+        if len(set(symbols)) != len(symbols):
+            raise FormatParseError("There are repeated symbols")
+
+        symbol_set = set(symbols)
+        for _, symbol, _ in edges:
+            if symbol is not None and symbol not in symbol_set:
+                raise FormatParseError(
+                    f"Symbol {symbol} is not in the set of symbols",
+                )
+
+        states = [
+            aut.State(name, is_final=bool(final))
+            for name, final in zip(names, finals)
+        ]
         return aut.FiniteAutomaton(
-            initial_state=initial_state,
+            initial_state=states[initial_state],
+            states=states,
             symbols=symbols,
-            states=states.values(),
-            transitions=transitions,
+            transitions=[
+                aut.Transition(states[state1], symbol, states[state2])
+                for state1, symbol, state2 in edges
+            ],
+            validate=False,
         )
 
+    @classmethod
+    def _normalize(cls, line: str) -> Sequence[str]:
+        """
+        Reconoce una linea con las expresiones regulares y la devuelve
+        separada como la espera read_tokens (vacia si no es valida).
+        """
+        match = cls.re_symbols.fullmatch(line)
+        if match:
+            return ["Symbols:", match.group(1)]
+
+        match = cls.re_state.fullmatch(line)
+        if match:
+            state_name, final_text = match.groups()
+            return [state_name, "final"] if final_text else [state_name]
+
+        match = cls.re_initial.fullmatch(line)
+        if match:
+            return ["-->", match.group(1)]
+
+        match = cls.re_transition.fullmatch(line)
+        if match:
+            state1_name, symbol, state2_name = match.groups()
+            return [state1_name, f"-{symbol or ''}->", state2_name]
+
+        return []
+
     @classmethod
     def write(cls, automaton: aut.FiniteAutomaton) -> str:
         """Write the automaton description in our custom format."""
-        return (
-            "Automaton:\n"
-            + "\tSymbols: "
-            + "".join(
-                f"{s}"
-                for s in automaton.symbols
-            )
-            + "\n\n"
-            + "".join(
-                f"\t{s.name}{' final' if s.is_final else ''}\n"
-                for s in automaton.states
-            )
-            + "\n"
-            + f"\t--> {automaton.initial_state.name}\n"
-            + "".join(
+        output = io.StringIO()
+        cls.write_stream(automaton, output)
+        return output.getvalue()
+
+    @classmethod
+    def write_stream(
+        cls,
+        automaton: aut.FiniteAutomaton,
+        file: TextIO,
+    ) -> None:
+        """
+        Write the automaton description in our custom format line by line.
+
+        Args:
+            automaton: Automaton to write.
+            file: Text file where the description is written.
+
+        """
+        file.write("Automaton:\n")
+        file.write(f"\tSymbols: {''.join(automaton.symbols)}\n\n")
+        for s in automaton.states:
+            file.write(f"\t{s.name}{' final' if s.is_final else ''}\n")
+        file.write(f"\n\t--> {automaton.initial_state.name}\n")
+        for t in automaton.transitions:
+            file.write(
                 f"\t{t.initial_state.name} "
                 f"-{t.symbol if t.symbol is not None else ''}->"
-                f" {t.final_state.name}\n"
-                for t in automaton.transitions
+                f" {t.final_state.name}\n",
             )
+
+
+class _StringTable(Sequence[str]):
+    """
+    Secuencia de cadenas guardadas en un buffer, que solo se decodifican al
+    acceder a ellas.
+    """
+
+    def __init__(self, data: memoryview, offsets: Sequence[int]) -> None:
+        self._data = data
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[str]: ...
+
+    def __getitem__(
+        self,
+        index: Union[int, slice],
+    ) -> Union[str, Sequence[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("String table index out of range")
+        return str(
+            self._data[self._offsets[index]:self._offsets[index + 1]],
+            "utf-8",
         )
 
 
+class BinaryAutomataFormat():
+    """
+    Binary format to write and read automata in compact form.
+
+    The file has a header, the transition arrays (``offsets``, ``labels``
+    and ``targets``), the final bitmap and the tables of symbols and state
+    names. Everything is little-endian and aligned, so reading a file (or a
+    ``mmap`` of it) only creates views over the buffer, without copying it or
+    creating one object per state.
+    """
+
+    magic: Final = b"AUTB"
+    version: Final = 1
+    header: Final = struct.Struct("<4s7I")
+
+    @classmethod
+    def write(
+        cls,
+        automaton: Union[aut.FiniteAutomaton, CompactAutomaton],
+    ) -> bytes:
+        """Write the automaton in the binary format."""
+        if isinstance(automaton, aut.FiniteAutomaton):
+            automaton = CompactAutomaton.from_automaton(automaton)
+
+        symbols = [s.encode("utf-8") for s in automaton.symbols]
+        names = [s.encode("utf-8") for s in automaton.state_names]
+
+        def table_offsets(strings: List[bytes]) -> "array[int]":
+            offsets = array("i", [0])
+            for string in strings:
+                offsets.append(offsets[-1] + len(string))
+            return offsets
+
+        arrays = [
+            array("i", automaton.offsets),
+            array("i", automaton.labels),
+            array("i", automaton.targets),
+            table_offsets(symbols),
+            table_offsets(names),
+        ]
+        if sys.byteorder != "little":
+            for a in arrays:
+                a.byteswap()
+
+        final = bytes(automaton.final)
+        strings = b"".join(symbols) + b"".join(names)
+        return b"".join([
+            cls.header.pack(
+                cls.magic,
+                cls.version,
+                automaton.num_states,
+                len(automaton.symbols),
+                len(automaton.targets),
+                automaton.initial_state,
+                len(final),
+                len(strings),
+            ),
+            *(a.tobytes() for a in arrays),
+            final,
+            strings,
+        ])
+
+    @classmethod
+    def read(
+        cls,
+        buffer: Union[bytes, bytearray, memoryview, mmap.mmap],
+    ) -> CompactAutomaton:
+        """
+        Read an automaton in the binary format.
+
+        The arrays of the automaton are views over the buffer, which must not
+        be modified while the automaton is in use.
+
+        """
+        data = memoryview(buffer)
+        if len(data) < cls.header.size:
+            raise FormatParseError("Truncated automaton header")
+
+        (
+            magic,
+            version,
+            num_states,
+            num_symbols,
+            num_transitions,
+            initial_state,
+            final_size,
+            strings_size,
+        ) = cls.header.unpack_from(data)
+        if magic != cls.magic:
+            raise FormatParseError("Not a binary automaton")
+        if version != cls.version:
+            raise FormatParseError(f"Unsupported version {version}")
+
+        sizes = [
+            num_states + 1,
+            num_transitions,
+            num_transitions,
+            num_symbols + 1,
+            num_states + 1,
+        ]
+        expected = cls.header.size + 4 * sum(sizes) + final_size + strings_size
+        if len(data) != expected:
+            raise FormatParseError("Wrong size of the binary automaton")
+
+        arrays: List[Sequence[int]] = []
+        position = cls.header.size
+        for size in sizes:
+            view = data[position:position + 4 * size]
+            if sys.byteorder == "little":
+                arrays.append(view.cast("i"))
+            else:
+                copy = array("i", view.tobytes())
+                copy.byteswap()
+                arrays.append(copy)
+            position += 4 * size
+        offsets, labels, targets, symbol_offsets, name_offsets = arrays
+
+        final = data[position:position + final_size]
+        position += final_size
+        symbols = _StringTable(data[position:], symbol_offsets)
+        names = _StringTable(
+            data[position + symbol_offsets[-1]:position + strings_size],
+            name_offsets,
+        )
+
+        try:
+            return CompactAutomaton(
+                state_names=names,
+                symbols=tuple(symbols),
+                initial_state=initial_state,
+                final=final,
+                offsets=offsets,
+                labels=labels,
+                targets=targets,
+            )
+        except ValueError as e:
+            raise FormatParseError(str(e)) from e
+
+    @classmethod
+    def open(cls, path: str) -> CompactAutomaton:
+        """Map a file in the binary format and read the automaton from it."""
+        with open(path, "rb") as f:
+            # El mmap sigue abierto mientras haya vistas sobre el
+            return cls.read(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
 def write_dot(automaton: aut.FiniteAutomaton) -> str:
     """
     Write a dot representation of the automaton.
@@ -125,6 +436,20 @@ def write_dot(automaton: aut.FiniteAutomaton) -> str:
     Returns:
         Representation of the automaton in dot (Graphviz) language.
 
+    """
+    output = io.StringIO()
+    write_dot_stream(automaton, output)
+    return output.getvalue()
+
+
+def write_dot_stream(automaton: aut.FiniteAutomaton, file: TextIO) -> None:
+    """
+    Write a dot representation of the automaton line by line.
+
+    Args:
+        automaton: Automaton to print.
+        file: Text file where the representation is written.
+
     """
     shape_dict = {
         True: "doublecircle",
@@ -134,24 +459,21 @@ def write_dot(automaton: aut.FiniteAutomaton) -> str:
     def symbol_repr(symbol: Optional[str]) -> str:
         return "λ" if symbol is None else symbol
 
-    return (
+    file.write(
         "digraph {\n"
         "  rankdir=LR;\n"
         "\n"
-        + "  node [shape = point]; __start_point__\n"
-        + "".join(
-            f"  {s.name}[shape={shape_dict[s.is_final]}]\n"
-            for s in automaton.states
-        )
-        + "\n"
-        + f"  __start_point__ -> {automaton.initial_state.name}\n"
-        + "".join(
+        "  node [shape = point]; __start_point__\n",
+    )
+    for s in automaton.states:
+        file.write(f"  {s.name}[shape={shape_dict[s.is_final]}]\n")
+    file.write(f"\n  __start_point__ -> {automaton.initial_state.name}\n")
+    for t in automaton.transitions:
+        file.write(
             f"  {t.initial_state.name} -> {t.final_state.name}"
-            f"[label=\"{symbol_repr(t.symbol)}\"]\n"
-            for t in automaton.transitions
+            f"[label=\"{symbol_repr(t.symbol)}\"]\n",
         )
-        + "}\n"
-    )
+    file.write("}\n")
 
 
 def is_deterministic(